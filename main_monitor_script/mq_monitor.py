@@ -13,24 +13,31 @@ Version: 3.0.0
 
 import os
 import sys
+import re
 import time
-import yaml
 import json
+import csv
 import argparse
 import platform
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from pathlib import Path
 from datetime import datetime
-from tabulate import tabulate
 from colorama import init, Fore, Style
 import logging
 import logging.config
 import locale
 import codecs
-from logging.handlers import RotatingFileHandler
+import queue
+import atexit
+from collections import namedtuple
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 # Initialize colorama for proper color display on all platforms
-init(strip=not sys.stdout.isatty())
+_STDOUT_IS_TTY = sys.stdout.isatty()
+init(strip=not _STDOUT_IS_TTY)
 
 # Set default encoding for file operations
 if sys.stdout.encoding is None or sys.stdout.encoding == 'ascii':
@@ -45,20 +52,94 @@ except ImportError:
     print(f"{Fore.YELLOW}Note: IBM MQ client libraries must be installed for pymqi to work.")
     sys.exit(1)
 
+# orjson is optional, JSON output falls back to the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Status constants
 STATUS_OK = "OK"
 STATUS_WARNING = "WARNING"
 STATUS_CRITICAL = "CRITICAL"
 STATUS_UNKNOWN = "UNKNOWN"
 
-# System information detection
-SYSTEM_INFO = {
-    'system': platform.system(),
-    'release': platform.release(),
-    'version': platform.version(),
-    'machine': platform.machine(),
-    'processor': platform.processor()
+# Console colors of status lines
+STATUS_COLORS = {
+    STATUS_OK: Fore.GREEN,
+    STATUS_WARNING: Fore.YELLOW,
+    STATUS_CRITICAL: Fore.RED
 }
+_STATUS_COLOR_GET = STATUS_COLORS.get
+
+# System information detection (single uname() call at import)
+SystemInfo = namedtuple('SystemInfo', ['system', 'release', 'version', 'machine', 'processor'])
+_uname = platform.uname()
+SYSTEM_INFO = SystemInfo(_uname.system, _uname.release, _uname.version, _uname.machine, _uname.processor)
+_IS_WINDOWS = SYSTEM_INFO.system == 'Windows'
+
+# Default SSL/TLS key repository for this platform
+_DEFAULT_SSL_KEY_REPOSITORY = os.path.expandvars('%MQDATA%\\ssl\\key') if _IS_WINDOWS else '/var/mqm/ssl/key'
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler with buffered writes and in-memory size tracking.
+
+    Records are flushed to disk on WARNING and higher, every flush_interval
+    seconds and on close. Rollover is decided from a size counter instead of
+    seeking the file for every record.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None,
+                 flush_interval=30, buffer_size=65536):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self._size = self.stream.tell() if self.stream else 0
+        self._last_flush = time.monotonic()
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name='log-flusher', daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+
+    def _flush_periodically(self):
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def doRollover(self):
+        super().doRollover()
+        self._size = self.stream.tell() if self.stream else 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+                self._size = self.stream.tell()
+            # Size is counted in characters, close enough for rotation purposes
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= logging.WARNING or time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._stop_flusher.set()
+        super().close()
+
+# Log directories already created during this process
+_checked_log_dirs = set()
 
 def setup_logging(config, args):
     """Set up logging with respect to platform and configuration."""
@@ -88,6 +169,7 @@ def setup_logging(config, args):
     }
 
     # Check if logging is enabled
+    file_handler = None
     logging_config = config['output'].get('logging', {})
     if logging_config.get('enabled', False):
         try:
@@ -95,90 +177,73 @@ def setup_logging(config, args):
             log_dir = logging_config.get('directory')
             if log_dir is None:
                 # Use platform-specific directory
-                if platform.system() == 'Windows':
+                if _IS_WINDOWS:
                     log_dir = config['platform_specific']['windows']['log_dir']
                     # Expand environment variables in Windows path
                     log_dir = os.path.expandvars(log_dir)
                 else:
                     log_dir = config['platform_specific']['unix']['log_dir']
 
-            # Create log directory
+            # Create log directory (only once per directory)
             log_path = Path(log_dir)
-            try:
-                log_path.mkdir(parents=True, exist_ok=True)
-                # Only logging, no output to console
-                logging.debug(f"Log directory created/exists: {log_dir}")
-            except PermissionError:
-                print(f"{Fore.YELLOW}Warning: I don't have permission to create log directory: {log_dir}{Style.RESET_ALL}")
-                # Use temporary directory as backup
-                log_dir = tempfile.gettempdir()
-                log_path = Path(log_dir)
-                print(f"{Fore.YELLOW}Using temporary directory: {log_dir}{Style.RESET_ALL}")
-            except Exception as e:
-                print(f"{Fore.YELLOW}Warning: Cannot create log directory: {e}{Style.RESET_ALL}")
-                log_dir = tempfile.gettempdir()
-                log_path = Path(log_dir)
-                print(f"{Fore.YELLOW}Using temporary directory: {log_dir}{Style.RESET_ALL}")
+            if log_dir not in _checked_log_dirs:
+                try:
+                    log_path.mkdir(parents=True, exist_ok=True)
+                    _checked_log_dirs.add(log_dir)
+                    # Only logging, no output to console
+                    logging.debug(f"Log directory created/exists: {log_dir}")
+                except PermissionError:
+                    print(f"{Fore.YELLOW}Warning: I don't have permission to create log directory: {log_dir}{Style.RESET_ALL}")
+                    # Use temporary directory as backup
+                    log_dir = tempfile.gettempdir()
+                    log_path = Path(log_dir)
+                    print(f"{Fore.YELLOW}Using temporary directory: {log_dir}{Style.RESET_ALL}")
+                except Exception as e:
+                    print(f"{Fore.YELLOW}Warning: Cannot create log directory: {e}{Style.RESET_ALL}")
+                    log_dir = tempfile.gettempdir()
+                    log_path = Path(log_dir)
+                    print(f"{Fore.YELLOW}Using temporary directory: {log_dir}{Style.RESET_ALL}")
             
             # Build log file path
             log_file = log_path / logging_config.get('filename', 'mq_monitor.log')
             
-            # Check if it's possible to write to the file
-            try:
-                # Try to open file for writing
-                with open(log_file, 'a'):
-                    pass
-            except PermissionError:
-                print(f"{Fore.YELLOW}Warning: I don't have permission to write to file: {log_file}{Style.RESET_ALL}")
-                # Use temporary file as backup
-                log_file = Path(tempfile.gettempdir()) / logging_config.get('filename', 'mq_monitor.log')
-                print(f"{Fore.YELLOW}Using temporary file: {log_file}{Style.RESET_ALL}")
-            except Exception as e:
-                print(f"{Fore.YELLOW}Warning: Cannot write to file: {e}{Style.RESET_ALL}")
-                log_file = Path(tempfile.gettempdir()) / logging_config.get('filename', 'mq_monitor.log')
-                print(f"{Fore.YELLOW}Using temporary file: {log_file}{Style.RESET_ALL}")
-            
             # Set rotating handler
             max_size = logging_config.get('max_size', 10485760)  # 10MB default
             backup_count = logging_config.get('backup_count', 5)
             
+            flush_interval = logging_config.get('flush_interval', 30)
+            
+            # The handler opens the file itself, so it also serves as the writability check
             try:
-                file_handler = RotatingFileHandler(
+                file_handler = BufferedRotatingFileHandler(
                     str(log_file),
                     maxBytes=max_size,
                     backupCount=backup_count,
-                    encoding='utf-8'
+                    encoding='utf-8',
+                    flush_interval=flush_interval
                 )
+            except (PermissionError, OSError) as e:
+                print(f"{Fore.YELLOW}Warning: Cannot write to file {log_file}: {e}{Style.RESET_ALL}")
+                # Use temporary file as backup
+                log_file = Path(tempfile.gettempdir()) / logging_config.get('filename', 'mq_monitor.log')
+                print(f"{Fore.YELLOW}Using temporary log file: {log_file}{Style.RESET_ALL}")
+                try:
+                    file_handler = BufferedRotatingFileHandler(
+                        str(log_file),
+                        maxBytes=max_size,
+                        backupCount=backup_count,
+                        encoding='utf-8',
+                        flush_interval=flush_interval
+                    )
+                except (PermissionError, OSError) as e:
+                    print(f"{Fore.YELLOW}Warning: Cannot set up logging to file: {e}{Style.RESET_ALL}")
+                    file_handler = None
+            
+            if file_handler is not None:
                 file_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
-                log_config['handlers']['file'] = {
-                    'class': 'logging.handlers.RotatingFileHandler',
-                    'filename': str(log_file),
-                    'maxBytes': max_size,
-                    'backupCount': backup_count,
-                    'formatter': 'verbose',
-                    'encoding': 'utf-8',
-                    'level': 'DEBUG' if args.verbose else 'INFO'  # File log everything
-                }
-                log_config['root']['handlers'].append('file')
-                
+                file_handler.setLevel(logging.DEBUG if args.verbose else logging.INFO)  # File log everything
                 # Only logging, no output to console
                 logging.debug(f"Logging set up to: {log_file}")
-                
-            except Exception as e:
-                print(f"{Fore.YELLOW}Warning: Cannot set up logging to file: {e}{Style.RESET_ALL}")
-                # Use temporary directory as backup
-                temp_log = Path(tempfile.gettempdir()) / 'mq_monitor.log'
-                print(f"{Fore.YELLOW}Using temporary log file: {temp_log}{Style.RESET_ALL}")
-                log_config['handlers']['file'] = {
-                    'class': 'logging.handlers.RotatingFileHandler',
-                    'filename': str(temp_log),
-                    'maxBytes': 10485760,
-                    'backupCount': 5,
-                    'formatter': 'verbose',
-                    'encoding': 'utf-8',
-                    'level': 'DEBUG' if args.verbose else 'INFO'  # File log everything
-                }
-                log_config['root']['handlers'].append('file')
         
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Cannot set up logging: {e}{Style.RESET_ALL}")
@@ -186,9 +251,19 @@ def setup_logging(config, args):
 
     # Apply logging configuration
     logging.config.dictConfig(log_config)
+    if file_handler is not None:
+        # File writes happen on the listener thread, callers only enqueue records
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(file_handler.level)
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        # Registered after logging's own atexit hook, so it runs first and drains the queue
+        atexit.register(listener.stop)
+        logging.getLogger().addHandler(queue_handler)
     
     # These messages will only be logged, not to console
-    logging.info(f"Running on system: {SYSTEM_INFO['system']} {SYSTEM_INFO['release']}")
+    logging.info(f"Running on system: {SYSTEM_INFO.system} {SYSTEM_INFO.release}")
     
     # Log absolute path to config file
     try:
@@ -208,12 +283,8 @@ def setup_logging(config, args):
 
 def safe_encode(text, encoding='utf-8'):
     """Safely encode text for MQ with platform support."""
-    if isinstance(text, bytes):
-        return text
-    try:
-        return text.encode(encoding)
-    except UnicodeEncodeError:
-        return text.encode(encoding, errors='replace')
+    # 'replace' only changes the result for characters the encoding cannot represent
+    return text if isinstance(text, bytes) else text.encode(encoding, errors='replace')
 
 def safe_decode(text, encoding='utf-8'):
     """Safely decode text from MQ with platform support."""
@@ -249,25 +320,187 @@ QUEUE_TYPE_MAP = {
     pymqi.CMQC.MQQT_CLUSTER: "CLUSTER",
 }
 
-def get_queue_usage(usage):
+# Bound lookups used for every channel/queue
+_CHS_GET = CHANNEL_STATUS_MAP.get
+_QT_GET = QUEUE_TYPE_MAP.get
+
+# PCF selectors used when building channel and queue records, bound once at import
+_MQCA_CLUSTER_NAME = pymqi.CMQC.MQCA_CLUSTER_NAME
+_MQCA_Q_DESC = pymqi.CMQC.MQCA_Q_DESC
+_MQCA_Q_NAME = pymqi.CMQC.MQCA_Q_NAME
+_MQIA_CURRENT_Q_DEPTH = pymqi.CMQC.MQIA_CURRENT_Q_DEPTH
+_MQIA_DEF_PERSISTENCE = pymqi.CMQC.MQIA_DEF_PERSISTENCE
+_MQIA_MAX_Q_DEPTH = pymqi.CMQC.MQIA_MAX_Q_DEPTH
+_MQIA_OPEN_INPUT_COUNT = pymqi.CMQC.MQIA_OPEN_INPUT_COUNT
+_MQIA_OPEN_OUTPUT_COUNT = pymqi.CMQC.MQIA_OPEN_OUTPUT_COUNT
+_MQIA_Q_TYPE = pymqi.CMQC.MQIA_Q_TYPE
+_MQQT_LOCAL = pymqi.CMQC.MQQT_LOCAL
+_SYSTEM_QUEUE_FILTER = pymqi.Filter(pymqi.CMQC.MQCA_Q_NAME)
+_MQIA_USAGE = pymqi.CMQC.MQIA_USAGE
+_MQCACH_CHANNEL_NAME = pymqi.CMQCFC.MQCACH_CHANNEL_NAME
+_MQCACH_LAST_MSG_DATE = pymqi.CMQCFC.MQCACH_LAST_MSG_DATE
+_MQCACH_LAST_MSG_TIME = pymqi.CMQCFC.MQCACH_LAST_MSG_TIME
+_MQIACH_CHANNEL_STATUS = pymqi.CMQCFC.MQIACH_CHANNEL_STATUS
+_MQIACH_CHANNEL_TYPE = pymqi.CMQCFC.MQIACH_CHANNEL_TYPE
+_MQIACH_MSGS = pymqi.CMQCFC.MQIACH_MSGS
+
+# System objects hidden from monitoring output (SYSTEM.ADMIN.* objects are kept)
+_HIDDEN_SYSTEM_NAME = re.compile(rb'SYSTEM\.(?!ADMIN)').match
+
+# Channel classification keys used internally, not part of JSON output
+_INTERNAL_CHANNEL_KEYS = frozenset(('is_system', 'show'))
+
+# PCF reason codes of a Queue Manager that does not accept filter parameters
+_PCF_FILTER_REJECTED = frozenset((
+    pymqi.CMQCFC.MQRCCF_FILTER_ERROR,
+    pymqi.CMQCFC.MQRCCF_CFSF_PARM_ID_ERROR,
+    pymqi.CMQCFC.MQRCCF_CFSF_OPERATOR_ERROR,
+    pymqi.CMQCFC.MQRCCF_CFSF_FILTER_VAL_LEN_ERROR,
+    pymqi.CMQCFC.MQRCCF_STRUCTURE_TYPE_ERROR
+))
+
+# Resolved monitoring rules (specific settings merged over global ones)
+ChannelRule = namedtuple('ChannelRule', [
+    'required_status', 'max_connections', 'warning_connections', 'inactive_warning',
+    'msg_wrong_status', 'msg_max_connections', 'msg_high_connections', 'msg_inactive'
+])
+
+QueueRule = namedtuple('QueueRule', [
+    'max_depth', 'warning_depth', 'max_depth_percent', 'warning_depth_percent',
+    'stuck_queue_warning', 'required_consumers',
+    'msg_max_depth', 'msg_high_depth', 'msg_max_depth_percent', 'msg_high_depth_percent',
+    'msg_stuck_messages', 'msg_no_consumers', 'empty_queue_ok'
+])
+
+class QueueRecord:
+    """Queue information and status joined from PCF responses."""
+    __slots__ = ('name', 'is_system', 'type', 'depth', 'max_depth', 'depth_percent',
+                 'open_input', 'open_output', 'description', 'cluster', 'usage', 'persistence',
+                 'check_status')
+
+    def __init__(self, name, is_system, type, depth, max_depth, open_input, open_output,
+                 description, cluster, usage, persistence):
+        self.name = name
+        self.is_system = is_system
+        self.type = type
+        self.depth = depth
+        self.max_depth = max_depth
+        self.depth_percent = (depth / max_depth * 100) if max_depth > 0 else 0
+        self.open_input = open_input
+        self.open_output = open_output
+        self.description = description
+        self.cluster = cluster
+        self.usage = usage
+        self.persistence = persistence
+        self.check_status = None
+
+    # Fields written to JSON output, is_system only drives checks and logging
+    OUTPUT_FIELDS = tuple(field for field in __slots__ if field != 'is_system')
+
+    def to_dict(self):
+        """Returns queue record as dictionary (for JSON output)."""
+        return {field: getattr(self, field) for field in self.OUTPUT_FIELDS}
+
+class PooledConnection:
+    """Open Queue Manager connection with its PCFExecute handle, kept in the connection pool."""
+    __slots__ = ('qmgr', 'pcf', 'pcf_filters')
+
+    def __init__(self, qmgr):
+        self.qmgr = qmgr
+        # One PCFExecute is used for all PCF commands on the connection
+        self.pcf = pymqi.PCFExecute(qmgr)
+        # Cleared once the Queue Manager rejects PCF filter parameters
+        self.pcf_filters = True
+
+    def close(self):
+        """Closes PCFExecute handle and disconnects from Queue Manager."""
+        try:
+            self.pcf.disconnect()
+        except Exception as e:
+            logging.debug(f"Error closing PCF handle: {e}")
+        self.qmgr.disconnect()
+
+def merge_rule_config(global_config, specific_config):
+    """Merges specific object settings over global ones, including messages."""
+    global_config = global_config or {}
+    specific_config = specific_config or {}
+    merged = dict(global_config)
+    merged.update(specific_config)
+    merged['messages'] = dict(global_config.get('messages') or {})
+    merged['messages'].update(specific_config.get('messages') or {})
+    return merged
+
+def build_channel_rule(channel_config):
+    """Builds ChannelRule from merged channel configuration."""
+    messages = channel_config['messages']
+    return ChannelRule(
+        required_status=channel_config.get('required_status'),
+        max_connections=channel_config.get('max_connections'),
+        warning_connections=channel_config.get('warning_connections', 0),
+        inactive_warning=channel_config.get('inactive_warning', False),
+        msg_wrong_status=messages.get('wrong_status'),
+        msg_max_connections=messages.get('max_connections'),
+        msg_high_connections=messages.get('high_connections'),
+        msg_inactive=messages.get('inactive')
+    )
+
+def build_queue_rule(queue_config):
+    """Builds QueueRule from merged queue configuration."""
+    messages = queue_config['messages']
+    max_depth = queue_config.get('max_depth')
+    warning_depth = queue_config.get('warning_depth', 0)
+    max_depth_percent = queue_config.get('max_depth_percent', 100)
+    warning_depth_percent = queue_config.get('warning_depth_percent', 80)
+    return QueueRule(
+        max_depth=max_depth,
+        warning_depth=warning_depth,
+        max_depth_percent=max_depth_percent,
+        warning_depth_percent=warning_depth_percent,
+        stuck_queue_warning=queue_config.get('stuck_queue_warning', False),
+        required_consumers=queue_config.get('required_consumers'),
+        msg_max_depth=messages.get('max_depth'),
+        msg_high_depth=messages.get('high_depth'),
+        msg_max_depth_percent=messages.get('max_depth_percent'),
+        msg_high_depth_percent=messages.get('high_depth_percent'),
+        msg_stuck_messages=messages.get('stuck_messages'),
+        msg_no_consumers=messages.get('no_consumers'),
+        # No depth or utilization threshold can be reached by an empty queue
+        empty_queue_ok=((max_depth is None or min(max_depth, warning_depth) > 0)
+                        and min(max_depth_percent, warning_depth_percent) > 0)
+    )
+
+# Queue usage mapping
+QUEUE_USAGE_MAP = {
+    pymqi.CMQC.MQUS_NORMAL: "NORMAL",
+    pymqi.CMQC.MQUS_TRANSMISSION: "TRANSMISSION"
+}
+
+# Default persistence mapping
+PERSISTENCE_MAP = {
+    pymqi.CMQC.MQPER_PERSISTENT: "PERSISTENT",
+    pymqi.CMQC.MQPER_NOT_PERSISTENT: "NOT_PERSISTENT"
+}
+
+def add_check_message(status, msg_config, severity, template, *args):
+    """Adds check result to status, default message is formatted only when it is used."""
+    if msg_config:
+        status["status"] = msg_config['severity']
+        status["messages"].append(msg_config['text'])
+    else:
+        status["status"] = severity
+        status["messages"].append(template % args if args else template)
+
+def get_queue_usage(usage, _usage_map=QUEUE_USAGE_MAP):
     """Converts numeric queue usage value to text."""
-    usage_map = {
-        pymqi.CMQC.MQUS_NORMAL: "NORMAL",
-        pymqi.CMQC.MQUS_TRANSMISSION: "TRANSMISSION"
-    }
-    return usage_map.get(usage, "UNKNOWN")
+    return _usage_map.get(usage, "UNKNOWN")
 
-def get_persistence_status(persistence):
+def get_persistence_status(persistence, _persistence_map=PERSISTENCE_MAP):
     """Converts numeric persistence value to text."""
-    persistence_map = {
-        pymqi.CMQC.MQPER_PERSISTENT: "PERSISTENT",
-        pymqi.CMQC.MQPER_NOT_PERSISTENT: "NOT_PERSISTENT"
-    }
-    return persistence_map.get(persistence, "UNKNOWN")
+    return _persistence_map.get(persistence, "UNKNOWN")
 
 def get_queue_type_name(queue_type):
     """Converts numeric queue type to text description."""
-    return QUEUE_TYPE_MAP.get(queue_type, "UNKNOWN")
+    return _QT_GET(queue_type, "UNKNOWN")
 
 class MQMonitor:
     def __init__(self, config):
@@ -276,10 +509,45 @@ class MQMonitor:
         self.queue_thresholds = config.get('queues_monitoring', {})
         self.system_info = SYSTEM_INFO
         
+        # Resolve monitoring rules once, checks then only look them up by name
+        self._channel_rules, self._default_channel_rule = self._compile_rules(
+            self.channel_thresholds, build_channel_rule)
+        self._queue_rules, self._default_queue_rule = self._compile_rules(
+            self.queue_thresholds, build_queue_rule)
+        
         # Set default encoding for MQ communication
         self.encoding = config.get('global', {}).get('encoding', 'utf-8')
         logging.debug(f"Using encoding for MQ communication: {self.encoding}")
         
+        # Serializes printing and logging of monitoring results
+        self._output_lock = threading.Lock()
+        
+        # Output timestamps, formatted at most once per second
+        self._now_cache = None
+        
+        # Output log file is opened once and kept open until close_all()
+        self._log_fh = None
+        if "log_file" in config.get("output", {}):
+            try:
+                self._log_fh = open(config["output"]["log_file"], "a", buffering=1 << 16)
+            except OSError as e:
+                print(f"{Fore.YELLOW}Warning: Cannot open output log file {config['output']['log_file']}: {e}{Style.RESET_ALL}")
+        
+        # Open Queue Manager connections (PooledConnection) reused until close_all()
+        self._conn_pool = {}
+        
+        # Merge and encode connection settings and object patterns of all configured Queue Managers once
+        self._qm_server_configs = {}
+        self._encoded_connections = {}
+        self._encoded_patterns = {}
+        for server_config in config.get('mq_servers', []):
+            for qm_config in server_config.get('queue_managers', []):
+                key = (server_config.get('name'), qm_config['name'])
+                qm_server_config = self._qm_connection_config(server_config, qm_config)
+                self._qm_server_configs[key] = qm_server_config
+                self._encoded_connections[key] = self._encode_connection(qm_server_config)
+                self._encoded_patterns[key] = self._encode_patterns(qm_config)
+        
         # Detect SSL/TLS environment
         self.ssl_env = self._setup_ssl_environment()
         logging.debug(f"SSL/TLS environment: {self.ssl_env}")
@@ -287,28 +555,71 @@ class MQMonitor:
         # Log information about configuration
         logging.info(f"Initializing MQ monitor with {len(config.get('mq_servers', []))} servers")
 
+    def _compile_rules(self, thresholds, build_rule):
+        """Compiles global and specific thresholds into rules keyed by object name."""
+        global_config = thresholds.get('global') or {}
+        default_rule = build_rule(merge_rule_config(global_config, None))
+        rules = {
+            name: build_rule(merge_rule_config(global_config, specific_config))
+            for name, specific_config in (thresholds.get('specific') or {}).items()
+        }
+        return rules, default_rule
+
     def _setup_ssl_environment(self):
         """Sets up SSL/TLS environment according to platform."""
         ssl_env = {}
         try:
-            if self.system_info['system'] == 'Windows':
-                ssl_key_repo = self.config.get('platform_specific', {}).get('windows', {}).get('ssl_key_repository', '%MQDATA%\\ssl\\key')
+            if _IS_WINDOWS:
+                ssl_key_repo = self.config.get('platform_specific', {}).get('windows', {}).get('ssl_key_repository')
                 # Expand environment variables in Windows path
-                ssl_key_repo = os.path.expandvars(ssl_key_repo)
+                ssl_key_repo = os.path.expandvars(ssl_key_repo) if ssl_key_repo else _DEFAULT_SSL_KEY_REPOSITORY
             else:
-                ssl_key_repo = self.config.get('platform_specific', {}).get('unix', {}).get('ssl_key_repository', '/var/mqm/ssl/key')
+                ssl_key_repo = self.config.get('platform_specific', {}).get('unix', {}).get('ssl_key_repository', _DEFAULT_SSL_KEY_REPOSITORY)
             
             ssl_env['SSL_KEY_REPOSITORY'] = ssl_key_repo
             logging.debug(f"Set SSL_KEY_REPOSITORY: {ssl_key_repo}")
         except Exception as e:
             logging.warning(f"Cannot set up SSL environment: {e}")
-            if self.system_info['system'] == 'Windows':
-                ssl_env['SSL_KEY_REPOSITORY'] = '%MQDATA%\\ssl\\key'
-            else:
-                ssl_env['SSL_KEY_REPOSITORY'] = '/var/mqm/ssl/key'
+            ssl_env['SSL_KEY_REPOSITORY'] = _DEFAULT_SSL_KEY_REPOSITORY
         
         return ssl_env
 
+    def _qm_connection_config(self, server_config, qm_config):
+        """Builds connection settings for Queue Manager from server and QM configuration."""
+        qm_server_config = server_config.copy()
+        qm_server_config.update({
+            "queue_manager": qm_config["name"],
+            "channel": qm_config["channel"],
+            "port": qm_config.get("port", server_config.get("port", 1414)),
+            "user": qm_config.get("user"),
+            "password": qm_config.get("password"),
+            "ssl": qm_config.get("ssl", False),
+            "ssl_config": qm_config.get("ssl_config", {})
+        })
+        return qm_server_config
+
+    def _encode_patterns(self, qm_config):
+        """Encodes channel and queue patterns of Queue Manager, keeping the text for messages."""
+        return (
+            [(pattern, pattern.encode()) for pattern in qm_config.get('channels_to_monitor', ['*'])],
+            [(pattern, pattern.encode()) for pattern in qm_config.get('queues_to_monitor', ['*'])]
+        )
+
+    def _encode_connection(self, server_config):
+        """Encodes connection values of Queue Manager to bytes for pymqi."""
+        host_b = safe_encode(server_config.get('host', 'localhost'), self.encoding)
+        port_b = safe_encode(str(server_config.get('port', 1414)), self.encoding)
+        user = server_config.get('user')
+        password = server_config.get('password')
+        return {
+            "channel": safe_encode(server_config.get('channel', 'SYSTEM.DEF.SVRCONN'), self.encoding),
+            "queue_manager": safe_encode(server_config.get('queue_manager'), self.encoding),
+            "conn_info": host_b + b'(' + port_b + b')',
+            "cipher_spec": safe_encode(server_config.get('ssl_config', {}).get('cipher_spec', ''), self.encoding),
+            "user": safe_encode(user, self.encoding) if user else None,
+            "password": safe_encode(password, self.encoding) if password else None
+        }
+
     def connect_to_qm(self, server_config):
         """Connects to Queue Manager with respect to platform."""
         try:
@@ -319,45 +630,49 @@ class MQMonitor:
             user = server_config.get('user')
             password = server_config.get('password')
 
-            # Safely encode values
-            host_b = safe_encode(host, self.encoding)
-            port_b = safe_encode(str(port), self.encoding)
-            channel_b = safe_encode(channel, self.encoding)
-            queue_manager_b = safe_encode(queue_manager, self.encoding)
-            conn_info = host_b + b'(' + port_b + b')'
+            # Use values encoded at startup, encode only connections not known from config
+            encoded = self._encoded_connections.get((server_config.get('name'), queue_manager))
+            if encoded is None:
+                encoded = self._encode_connection(server_config)
 
             logging.debug(f"Connecting to {queue_manager} on {host}:{port}")
             
             cd = pymqi.CD()
-            cd.ChannelName = channel_b
-            cd.ConnectionName = conn_info
+            cd.ChannelName = encoded['channel']
+            cd.ConnectionName = encoded['conn_info']
             cd.ChannelType = pymqi.CMQC.MQCHT_CLNTCONN
             cd.TransportType = pymqi.CMQC.MQXPT_TCP
 
             # SSL/TLS configuration with respect to platform
+            sco = None
             if server_config.get('ssl', False):
                 ssl_config = server_config.get('ssl_config', {})
-                cd.SSLCipherSpec = safe_encode(ssl_config.get('cipher_spec', ''), self.encoding)
+                cd.SSLCipherSpec = encoded['cipher_spec']
                 
-                # Set SSL keys according to platform
+                # Key repository is set per connection, MQSSLKEYR would be shared by all worker threads
                 key_repo = ssl_config.get('key_repository', self.ssl_env['SSL_KEY_REPOSITORY'])
-                os.environ['MQSSLKEYR'] = key_repo
+                sco = pymqi.SCO()
+                sco.KeyRepository = safe_encode(key_repo, self.encoding)
                 
                 logging.debug(f"SSL configuration: cipher_spec={cd.SSLCipherSpec}, key_repo={key_repo}")
 
+            # Shared handle, the pool hands the connection to whichever worker thread monitors this QM next
+            opts = pymqi.CMQC.MQCNO_HANDLE_SHARE_BLOCK
+            
             # Connect with authentication
             if user and password:
                 logging.debug(f"Connecting with authentication (user: {user})")
-                sco = pymqi.SCO()
-                sco.UserIdentifier = safe_encode(user, self.encoding)
-                sco.Password = safe_encode(password, self.encoding)
+                if sco is None:
+                    sco = pymqi.SCO()
+                sco.UserIdentifier = encoded['user']
+                sco.Password = encoded['password']
                 qmgr = pymqi.QueueManager(None)
-                qmgr.connectWithOptions(queue_manager_b, cd=cd, sco=sco)
+                qmgr.connectWithOptions(encoded['queue_manager'], cd=cd, sco=sco, opts=opts)
                 logging.info(f"Successfully connected to {queue_manager} with authentication")
             else:
                 logging.debug("Connecting without authentication")
                 qmgr = pymqi.QueueManager(None)
-                qmgr.connectWithOptions(queue_manager_b, cd=cd)
+                qmgr.connectWithOptions(encoded['queue_manager'], cd=cd, sco=sco, opts=opts)
                 logging.info(f"Successfully connected to {queue_manager} without authentication")
 
             return qmgr
@@ -367,8 +682,63 @@ class MQMonitor:
             logging.error(f"MQ error during connection: {error_msg}")
             raise Exception(error_msg)
         except Exception as e:
-            logging.error(f"Unexpected error during connection: {e}", exc_info=True)
+            logging.error(f"Unexpected error during connection: {e}")
+            # Traceback is formatted only when debug logging is enabled
+            logging.debug("Connection error traceback", exc_info=True)
+            raise
+
+    def _pool_key(self, server_config):
+        """Returns connection pool key for Queue Manager connection settings."""
+        return (server_config.get('host', 'localhost'), server_config.get('port', 1414),
+                server_config.get('channel', 'SYSTEM.DEF.SVRCONN'), server_config.get('queue_manager'))
+
+    def _get_connection(self, server_config):
+        """Returns pooled connection to Queue Manager, reconnecting if it is no longer usable."""
+        key = self._pool_key(server_config)
+        conn = self._conn_pool.get(key)
+        if conn is not None:
+            try:
+                # Cheap liveness check instead of a new connect
+                conn.qmgr.inquire(pymqi.CMQC.MQCA_Q_MGR_NAME)
+                logging.debug(f"Reusing connection to {server_config.get('queue_manager')}")
+                return conn
+            except pymqi.MQMIError as e:
+                logging.info(f"Pooled connection to {server_config.get('queue_manager')} is not usable ({e}), reconnecting")
+                self._discard_connection(server_config)
+        
+        qmgr = self.connect_to_qm(server_config)
+        try:
+            conn = self._conn_pool[key] = PooledConnection(qmgr)
+        except Exception:
+            # PCFExecute opens its reply queue, do not leave the connection behind if that fails
+            qmgr.disconnect()
             raise
+        return conn
+
+    def _discard_connection(self, server_config):
+        """Removes connection from pool and disconnects it."""
+        conn = self._conn_pool.pop(self._pool_key(server_config), None)
+        if conn is None:
+            return
+        try:
+            conn.close()
+            logging.info(f"Disconnected from Queue Manager {server_config.get('queue_manager')}")
+        except Exception as e:
+            logging.debug(f"Error disconnecting from Queue Manager {server_config.get('queue_manager')}: {e}")
+
+    def close_all(self):
+        """Closes all pooled connections, cached PCFExecute handles and output log file."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+        
+        for (host, port, channel, queue_manager), conn in list(self._conn_pool.items()):
+            try:
+                conn.close()
+                logging.info(f"Disconnected from Queue Manager {queue_manager} on {host}:{port}")
+            except Exception as e:
+                logging.error(f"Error disconnecting from Queue Manager {queue_manager} on {host}:{port}: {e}")
+        self._conn_pool.clear()
 
     def _format_mq_error(self, e, host, queue_manager, channel):
         """Formats MQ errors with respect to platform and localization."""
@@ -383,11 +753,9 @@ class MQMonitor:
                 return "Insufficient permissions for connection"
         return f"MQ server connection error: {e}"
 
-    def get_queue_manager_status(self, qmgr, qmgr_name):
+    def get_queue_manager_status(self, pcf, qmgr_name):
         """Gets Queue Manager status."""
         try:
-            pcf = pymqi.PCFExecute(qmgr)
-            
             # First, get basic information about Queue Manager
             status_info = {
                 "name": qmgr_name,
@@ -441,255 +809,345 @@ class MQMonitor:
             "messages": []
         }
 
-        # Get specific configuration for channel or use global
-        channel_config = self.channel_thresholds.get('specific', {}).get(channel_name, 
-                                                                       self.channel_thresholds.get('global', {}))
-        
-        messages_config = channel_config.get('messages', {})
+        # Get specific rule for channel or use global
+        rule = self._channel_rules.get(channel_name, self._default_channel_rule)
 
         # Check channel status
-        if channel_config.get('required_status'):
-            if channel_info['status'] != channel_config['required_status']:
-                msg_config = messages_config.get('wrong_status', {
-                    'severity': 'WARNING',
-                    'text': f"Channel is not in required status (is {channel_info['status']}, required {channel_config['required_status']})"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
+        if rule.required_status:
+            if channel_info['status'] != rule.required_status:
+                add_check_message(status, rule.msg_wrong_status, 'WARNING',
+                                  "Channel is not in required status (is %s, required %s)",
+                                  channel_info['status'], rule.required_status)
 
         # Check connection count
         connections = channel_info.get('connections', 0)
-        if channel_config.get('max_connections'):
-            if connections >= channel_config['max_connections']:
-                msg_config = messages_config.get('max_connections', {
-                    'severity': 'CRITICAL',
-                    'text': f"Max connection count exceeded ({connections}/{channel_config['max_connections']})"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
-            elif connections >= channel_config.get('warning_connections', 0):
-                msg_config = messages_config.get('high_connections', {
-                    'severity': 'WARNING',
-                    'text': f"High connection count ({connections}/{channel_config['warning_connections']})"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
+        if rule.max_connections:
+            if connections >= rule.max_connections:
+                add_check_message(status, rule.msg_max_connections, 'CRITICAL',
+                                  "Max connection count exceeded (%s/%s)", connections, rule.max_connections)
+            elif connections >= rule.warning_connections:
+                add_check_message(status, rule.msg_high_connections, 'WARNING',
+                                  "High connection count (%s/%s)", connections, rule.warning_connections)
 
         # Check inactivity
-        if channel_config.get('inactive_warning') and channel_info['status'] == "INACTIVE":
-            msg_config = messages_config.get('inactive', {
-                'severity': 'WARNING',
-                'text': "Channel is inactive"
-            })
-            status["status"] = msg_config['severity']
-            status["messages"].append(msg_config['text'])
+        if rule.inactive_warning and channel_info['status'] == "INACTIVE":
+            add_check_message(status, rule.msg_inactive, 'WARNING', "Channel is inactive")
 
         return status
 
-    def check_queue_status(self, queue_name, queue_info):
+    def check_queue_status(self, queue_info):
         """Checks queue status according to configured rules."""
         status = {
             "status": STATUS_OK,
             "messages": []
         }
 
-        # Use milder rules for system queues
-        is_system_queue = queue_name.startswith("SYSTEM.")
+        # Use milder rules for system queues (classified when queue was read)
+        is_system_queue = queue_info.is_system
         
-        # Get specific configuration for queue or use global
-        queue_config = self.queue_thresholds.get('specific', {}).get(queue_name, 
-                                                                    self.queue_thresholds.get('global', {}))
-        
-        messages_config = queue_config.get('messages', {})
+        # Get specific rule for queue or use global
+        rule = self._queue_rules.get(queue_info.name, self._default_queue_rule)
+
+        # Empty queue with enough consumers cannot trigger any rule
+        depth = queue_info.depth
+        if depth == 0 and rule.empty_queue_ok and (
+                rule.required_consumers is None or queue_info.open_input >= rule.required_consumers):
+            return status
 
         # Check queue depth
-        depth = queue_info['depth']
-        if 'max_depth' in queue_config and not is_system_queue:
-            if depth >= queue_config['max_depth']:
-                msg_config = messages_config.get('max_depth', {
-                    'severity': 'CRITICAL',
-                    'text': f"Max queue depth exceeded ({depth}/{queue_config['max_depth']})"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
-            elif depth >= queue_config.get('warning_depth', 0):
-                msg_config = messages_config.get('high_depth', {
-                    'severity': 'WARNING',
-                    'text': f"High queue depth ({depth}/{queue_config['warning_depth']})"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
+        if rule.max_depth is not None and not is_system_queue:
+            if depth >= rule.max_depth:
+                add_check_message(status, rule.msg_max_depth, 'CRITICAL',
+                                  "Max queue depth exceeded (%s/%s)", depth, rule.max_depth)
+            elif depth >= rule.warning_depth:
+                add_check_message(status, rule.msg_high_depth, 'WARNING',
+                                  "High queue depth (%s/%s)", depth, rule.warning_depth)
 
         # Check depth percentage
-        depth_percent = queue_info['depth_percent']
+        depth_percent = queue_info.depth_percent
         if not is_system_queue:
-            if depth_percent >= queue_config.get('max_depth_percent', 100):
-                msg_config = messages_config.get('max_depth_percent', {
-                    'severity': 'CRITICAL',
-                    'text': f"Max queue utilization exceeded ({depth_percent:.1f}%)"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
-            elif depth_percent >= queue_config.get('warning_depth_percent', 80):
-                msg_config = messages_config.get('high_depth_percent', {
-                    'severity': 'WARNING',
-                    'text': f"High queue utilization ({depth_percent:.1f}%)"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
+            if depth_percent >= rule.max_depth_percent:
+                add_check_message(status, rule.msg_max_depth_percent, 'CRITICAL',
+                                  "Max queue utilization exceeded (%.1f%%)", depth_percent)
+            elif depth_percent >= rule.warning_depth_percent:
+                add_check_message(status, rule.msg_high_depth_percent, 'WARNING',
+                                  "High queue utilization (%.1f%%)", depth_percent)
 
         # Check "stuck" queue (queue with messages but no consumers)
-        if queue_config.get('stuck_queue_warning') and not is_system_queue:
-            if depth > 0 and queue_info['open_input'] == 0:
-                msg_config = messages_config.get('stuck_messages', {
-                    'severity': 'WARNING',
-                    'text': f"Queue contains messages ({depth}) but has no active consumers"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
+        if rule.stuck_queue_warning and not is_system_queue:
+            if depth > 0 and queue_info.open_input == 0:
+                add_check_message(status, rule.msg_stuck_messages, 'WARNING',
+                                  "Queue contains messages (%s) but has no active consumers", depth)
 
         # Check consumer count - only for non-system queues
-        if 'required_consumers' in queue_config and not is_system_queue:
-            if queue_info['open_input'] < queue_config['required_consumers']:
-                msg_config = messages_config.get('no_consumers', {
-                    'severity': 'WARNING',
-                    'text': f"Insufficient consumer count ({queue_info['open_input']}/{queue_config['required_consumers']})"
-                })
-                status["status"] = msg_config['severity']
-                status["messages"].append(msg_config['text'])
+        if rule.required_consumers is not None and not is_system_queue:
+            if queue_info.open_input < rule.required_consumers:
+                add_check_message(status, rule.msg_no_consumers, 'WARNING',
+                                  "Insufficient consumer count (%s/%s)", queue_info.open_input, rule.required_consumers)
 
         return status
 
-    def get_channel_status(self, qmgr, channel_pattern):
-        """Gets channel status."""
+    def check_queues(self, queues):
+        """Checks statuses of a batch of queues in one pass."""
+        check_queue_status = self.check_queue_status
+        for queue in queues:
+            # All queue rules are skipped for system queues
+            if queue.is_system:
+                queue.check_status = {"status": STATUS_OK, "messages": []}
+            else:
+                queue.check_status = check_queue_status(queue)
+        return queues
+
+    def get_channel_statuses_bulk(self, pcf, channel_pattern):
+        """Gets status of all channels matching pattern with two wildcard PCF queries."""
+        pattern_bytes = channel_pattern if isinstance(channel_pattern, bytes) else channel_pattern.encode()
+        args = {_MQCACH_CHANNEL_NAME: pattern_bytes}
+        
+        # First, get definitions of all matching channels
+        channels = pcf.MQCMD_INQUIRE_CHANNEL(args)
+        
+        # Then get status of all matching channels (only active channels have status)
+        statuses = {}
         try:
-            pcf = pymqi.PCFExecute(qmgr)
+            for status_info in pcf.MQCMD_INQUIRE_CHANNEL_STATUS(args):
+                # Channel can have more instances, use first one
+                statuses.setdefault(status_info[_MQCACH_CHANNEL_NAME].strip(), status_info)
+        except pymqi.MQMIError as e:
+            if not (e.comp == pymqi.CMQC.MQCC_FAILED and e.reason in (pymqi.CMQCFC.MQRCCF_CHL_STATUS_NOT_FOUND,
+                                                                      pymqi.CMQC.MQRC_NO_MSG_AVAILABLE)):
+                raise
+            # No matching channel is active
+            logging.debug(f"No channel status available for pattern {pattern_bytes.decode()}: {e}")
+        
+        # Join channel definitions and status on channel name
+        result = []
+        for channel_info in channels:
+            channel_name = channel_info[_MQCACH_CHANNEL_NAME].strip()
+            status_info = statuses.get(channel_name)
+            if status_info is None:
+                # Channel exists, but has no status (not active)
+                result.append({
+                    "name": channel_name.decode(),
+                    "is_system": channel_name.startswith(b'SYSTEM.'),
+                    "show": not _HIDDEN_SYSTEM_NAME(channel_name),
+                    "type": channel_info.get(_MQIACH_CHANNEL_TYPE, "Unknown"),
+                    "status": "INACTIVE",
+                    "last_msg_time": "Never",
+                    "messages": 0,
+                    "connections": 0
+                })
+                continue
             
-            # Query for channel status
-            args = {
-                pymqi.CMQCFC.MQCACH_CHANNEL_NAME: channel_pattern.encode() if isinstance(channel_pattern, str) else channel_pattern
+            channel = {
+                "name": channel_name.decode(),
+                "is_system": channel_name.startswith(b'SYSTEM.'),
+                "show": not _HIDDEN_SYSTEM_NAME(channel_name),
+                "type": status_info.get(_MQIACH_CHANNEL_TYPE, "Unknown"),
+                "status": _CHS_GET(status_info.get(_MQIACH_CHANNEL_STATUS, 0), "UNKNOWN"),
+                "last_msg_time": "Unknown",
+                "messages": status_info.get(_MQIACH_MSGS, 0),
+                "connections": 0  # Set to 0, as this attribute is not available
             }
             
+            # Try to get last message time
+            if _MQCACH_LAST_MSG_TIME in status_info:
+                channel["last_msg_time"] = status_info[_MQCACH_LAST_MSG_TIME].strip().decode()
+            elif _MQCACH_LAST_MSG_DATE in status_info and _MQCACH_LAST_MSG_TIME in status_info:
+                last_date = status_info[_MQCACH_LAST_MSG_DATE].strip().decode()
+                last_time = status_info[_MQCACH_LAST_MSG_TIME].strip().decode()
+                channel["last_msg_time"] = f"{last_date} {last_time}"
+            
+            result.append(channel)
+        
+        return result
+
+    def get_queues_bulk(self, conn, queue_pattern=b'*'):
+        """Gets status of all queues matching pattern with wildcard PCF queries on a pooled connection."""
+        pcf = conn.pcf
+        pattern_bytes = queue_pattern if isinstance(queue_pattern, bytes) else queue_pattern.encode()
+        
+        if pattern_bytes == b'*' and conn.pcf_filters:
+            # Let Queue Manager drop SYSTEM.* queues, SYSTEM.ADMIN.* queues are inquired separately
             try:
-                response = pcf.MQCMD_INQUIRE_CHANNEL_STATUS(args)
+                queues = self._inquire_queues(pcf, pattern_bytes, [_SYSTEM_QUEUE_FILTER.not_like(b'SYSTEM.*')])
             except pymqi.MQMIError as e:
-                if e.comp == pymqi.CMQC.MQCC_FAILED and e.reason == pymqi.CMQCFC.MQRCCF_CHL_STATUS_NOT_FOUND:
-                    # Channel exists, but has no status (not active)
-                    channel_info = pcf.MQCMD_INQUIRE_CHANNEL(args)[0]
-                    return {
-                        "name": channel_info[pymqi.CMQCFC.MQCACH_CHANNEL_NAME].strip().decode(),
-                        "type": channel_info.get(pymqi.CMQCFC.MQIACH_CHANNEL_TYPE, "Unknown"),
-                        "status": "INACTIVE",
-                        "last_msg_time": "Never",
-                        "messages": 0,
-                        "connections": 0
-                    }
-                raise
+                if e.comp != pymqi.CMQC.MQCC_FAILED:
+                    raise
+                if e.reason == pymqi.CMQC.MQRC_UNKNOWN_OBJECT_NAME:
+                    # Only system queues exist
+                    queues = []
+                elif e.reason in _PCF_FILTER_REJECTED:
+                    logging.debug(f"PCF filter not accepted by Queue Manager ({e}), filtering system queues locally")
+                    conn.pcf_filters = False
+                    return self._inquire_queues(pcf, pattern_bytes)
+                else:
+                    raise
             
-            if response:
-                channel_info = response[0]  # Take first response
-                status = channel_info.get(pymqi.CMQCFC.MQIACH_CHANNEL_STATUS, 0)
-                status_text = CHANNEL_STATUS_MAP.get(status, "UNKNOWN")
-                
-                channel = {
-                    "name": channel_info[pymqi.CMQCFC.MQCACH_CHANNEL_NAME].strip().decode(),
-                    "type": channel_info.get(pymqi.CMQCFC.MQIACH_CHANNEL_TYPE, "Unknown"),
-                    "status": status_text,
-                    "last_msg_time": "Unknown",
-                    "messages": channel_info.get(pymqi.CMQCFC.MQIACH_MSGS, 0),
-                    "connections": 0  # Set to 0, as this attribute is not available
-                }
-                
-                # Try to get last message time
-                if pymqi.CMQCFC.MQCACH_LAST_MSG_TIME in channel_info:
-                    channel["last_msg_time"] = channel_info[pymqi.CMQCFC.MQCACH_LAST_MSG_TIME].strip().decode()
-                elif pymqi.CMQCFC.MQCACH_LAST_MSG_DATE in channel_info and pymqi.CMQCFC.MQCACH_LAST_MSG_TIME in channel_info:
-                    last_date = channel_info[pymqi.CMQCFC.MQCACH_LAST_MSG_DATE].strip().decode()
-                    last_time = channel_info[pymqi.CMQCFC.MQCACH_LAST_MSG_TIME].strip().decode()
-                    channel["last_msg_time"] = f"{last_date} {last_time}"
-                
-                return channel
+            try:
+                return queues + self._inquire_queues(pcf, b'SYSTEM.ADMIN*')
+            except pymqi.MQMIError as e:
+                if e.comp == pymqi.CMQC.MQCC_FAILED and e.reason == pymqi.CMQC.MQRC_UNKNOWN_OBJECT_NAME:
+                    return queues
+                raise
+        
+        return self._inquire_queues(pcf, pattern_bytes)
+
+    def _inquire_queues(self, pcf, pattern_bytes, filters=None):
+        """Inquires queue information and status of matching queues and joins them."""
+        # First, get queue information for all matching queues
+        # (only local queues have status, other types would be dropped by the join anyway)
+        queue_response = pcf.MQCMD_INQUIRE_Q({_MQCA_Q_NAME: pattern_bytes, _MQIA_Q_TYPE: _MQQT_LOCAL}, filters)
+        queues_info = {}
+        for queue_info in queue_response:
+            queue_name = queue_info[_MQCA_Q_NAME].strip()
+            # Skip system queues if not explicitly requested
+            if _HIDDEN_SYSTEM_NAME(queue_name):
+                continue
+            queues_info[queue_name] = queue_info
         
+        if not queues_info:
+            return []
+        
+        # Then get status of all matching queues
+        try:
+            status_response = pcf.MQCMD_INQUIRE_Q_STATUS({_MQCA_Q_NAME: pattern_bytes}, filters)
         except pymqi.MQMIError as e:
-            if e.comp == pymqi.CMQC.MQCC_FAILED and e.reason == pymqi.CMQC.MQRC_UNKNOWN_OBJECT_NAME:
-                return None
-            logging.error(f"Error getting channel status {channel_pattern}: {e}")
-            return None
-        except Exception as e:
-            logging.error(f"Unexpected error getting channel status {channel_pattern}: {e}")
-            return None
+            if e.comp == pymqi.CMQC.MQCC_FAILED and e.reason in (pymqi.CMQC.MQRC_UNKNOWN_OBJECT_NAME,
+                                                                 pymqi.CMQC.MQRC_SELECTOR_ERROR):
+                # No queue with status matches the pattern
+                logging.debug(f"No queue status available for pattern {pattern_bytes.decode()}: {e}")
+                return []
+            raise
+        
+        # Join queue information and status on queue name (only queues with status)
+        queues = []
+        for status in status_response:
+            queue_name = status[_MQCA_Q_NAME].strip()
+            queue_info = queues_info.get(queue_name)
+            if queue_info is None:
+                continue
+            
+            queues.append(QueueRecord(
+                # MQ object names are restricted to ASCII characters
+                name=queue_name.decode('ascii'),
+                is_system=queue_name.startswith(b'SYSTEM.'),
+                type=_QT_GET(queue_info.get(_MQIA_Q_TYPE, 0), "UNKNOWN"),
+                depth=status.get(_MQIA_CURRENT_Q_DEPTH, 0),
+                max_depth=queue_info.get(_MQIA_MAX_Q_DEPTH, 0),
+                open_input=status.get(_MQIA_OPEN_INPUT_COUNT, 0),
+                open_output=status.get(_MQIA_OPEN_OUTPUT_COUNT, 0),
+                description=queue_info.get(_MQCA_Q_DESC, b'').strip().decode(),
+                cluster=queue_info.get(_MQCA_CLUSTER_NAME, b'').strip().decode(),
+                usage=QUEUE_USAGE_MAP.get(queue_info.get(_MQIA_USAGE, 0), "UNKNOWN"),
+                persistence=PERSISTENCE_MAP.get(queue_info.get(_MQIA_DEF_PERSISTENCE, 0), "UNKNOWN")
+            ))
+        
+        return queues
 
-    def get_queue_status(self, qmgr, queue_pattern):
-        """Gets queue status."""
+    def _monitor_one_qm(self, server_config, qm_config):
+        """Monitors one Queue Manager, returns its statuses or None on error."""
+        server_name = server_config["name"]
+        qm_name = qm_config["name"]
+        logging.info(f"Monitoring Queue Manager {qm_name} on server {server_name}")
+        
+        conn = None
         try:
-            pcf = pymqi.PCFExecute(qmgr)
+            # Server config merged with QM specific settings (built at startup for configured QMs)
+            qm_server_config = self._qm_server_configs.get((server_name, qm_name))
+            if qm_server_config is None:
+                qm_server_config = self._qm_connection_config(server_config, qm_config)
             
-            # Query for queue information
-            pattern_bytes = queue_pattern if isinstance(queue_pattern, bytes) else queue_pattern.encode()
-            args = {
-                pymqi.CMQC.MQCA_Q_NAME: pattern_bytes
-            }
+            conn = self._get_connection(qm_server_config)
+            logging.info(f"Successfully connected to Queue Manager {qm_name} on server {server_name}")
             
-            # First, get queue information
-            queue_response = pcf.MQCMD_INQUIRE_Q(args)
+            # One PCFExecute is used for all inquiries of this Queue Manager
+            pcf = conn.pcf
             
-            if queue_response:
-                queue_info = queue_response[0]  # Take first response
-                queue_name = queue_info[pymqi.CMQC.MQCA_Q_NAME].strip()
-                queue_type = queue_info.get(pymqi.CMQC.MQIA_Q_TYPE, 0)
-                
-                # Skip system queues if not explicitly requested
-                if queue_pattern == '*' and queue_name.startswith(b'SYSTEM.') and not queue_name.startswith(b'SYSTEM.ADMIN'):
-                    return None
-                
-                # Then get queue status
-                status_args = {
-                    pymqi.CMQC.MQCA_Q_NAME: queue_name
-                }
-                
+            # Get Queue Manager status
+            qmgr_status = self.get_queue_manager_status(pcf, qm_name)
+            logging.info(f"Got Queue Manager status: {qmgr_status['name']}, status: {qmgr_status['status']}")
+            
+            # Channel and queue patterns according to QM specific configuration (encoded at startup)
+            patterns = self._encoded_patterns.get((server_name, qm_name))
+            if patterns is None:
+                patterns = self._encode_patterns(qm_config)
+            channel_patterns, queue_patterns = patterns
+            
+            # Per-object status lines are logged only for non-system objects, or for all with debug enabled
+            root_logger = logging.getLogger()
+            log_objects = root_logger.isEnabledFor(logging.INFO)
+            log_system_objects = root_logger.getEffectiveLevel() == logging.DEBUG
+            
+            # Monitor channels
+            channels_status = []
+            
+            logging.debug(f"Monitoring channels with patterns: {[pattern for pattern, _ in channel_patterns]}")
+            for channel_pattern, channel_pattern_bytes in channel_patterns:
                 try:
-                    status_response = pcf.MQCMD_INQUIRE_Q_STATUS(status_args)
-                    
-                    if status_response:
-                        status = status_response[0]
-                        max_depth = queue_info.get(pymqi.CMQC.MQIA_MAX_Q_DEPTH, 0)
-                        current_depth = status.get(pymqi.CMQC.MQIA_CURRENT_Q_DEPTH, 0)
-                        
-                        queue = {
-                            "name": queue_name.decode() if isinstance(queue_name, bytes) else queue_name,
-                            "type": get_queue_type_name(queue_type),
-                            "depth": current_depth,
-                            "max_depth": max_depth,
-                            "depth_percent": (current_depth / max_depth * 100) if max_depth > 0 else 0,
-                            "open_input": status.get(pymqi.CMQC.MQIA_OPEN_INPUT_COUNT, 0),
-                            "open_output": status.get(pymqi.CMQC.MQIA_OPEN_OUTPUT_COUNT, 0),
-                            "description": queue_info.get(pymqi.CMQC.MQCA_Q_DESC, b'').strip().decode(),
-                            "cluster": queue_info.get(pymqi.CMQC.MQCA_CLUSTER_NAME, b'').strip().decode(),
-                            "usage": get_queue_usage(queue_info.get(pymqi.CMQC.MQIA_USAGE, 0)),
-                            "persistence": get_persistence_status(queue_info.get(pymqi.CMQC.MQIA_DEF_PERSISTENCE, 0))
-                        }
+                    for channel in self.get_channel_statuses_bulk(pcf, channel_pattern_bytes):
+                        status = self.check_channel_status(channel["name"], channel)
+                        channel["check_status"] = status
+                        channels_status.append(channel)
                         
-                        return queue
+                        # Log channel status only for non-system channels or if debug is enabled
+                        if log_objects and (log_system_objects or not channel['is_system']):
+                            log_msg = f"Channel: {channel['name']}, Status: {channel['status']}, Check Status: {status['status']}"
+                            if status['messages']:
+                                log_msg += f", Messages: {', '.join(status['messages'])}"
+                            logging.info(log_msg)
+                except pymqi.MQMIError as e:
+                    error_msg = f"Error getting channel list for pattern {channel_pattern}: {e}"
+                    logging.error(error_msg)
+                    # Print to console only if it's not a system channel pattern
+                    if not channel_pattern.startswith('SYSTEM.'):
+                        self._write_console(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
+            
+            # Monitor queues
+            queues_status = []
+            
+            logging.debug(f"Monitoring queues with patterns: {[pattern for pattern, _ in queue_patterns]}")
+            for queue_pattern, queue_pattern_bytes in queue_patterns:
+                try:
+                    for queue in self.check_queues(self.get_queues_bulk(conn, queue_pattern_bytes)):
+                        status = queue.check_status
+                        queues_status.append(queue)
                         
+                        # Log queue status only for non-system queues or if debug is enabled
+                        if log_objects and (log_system_objects or not queue.is_system):
+                            log_msg = f"Queue: {queue.name}, Type: {queue.type}, Depth: {queue.depth}/{queue.max_depth} ({queue.depth_percent:.1f}%), Consumers: {queue.open_input}, Status: {status['status']}"
+                            if status['messages']:
+                                log_msg += f", Messages: {', '.join(status['messages'])}"
+                            logging.info(log_msg)
                 except pymqi.MQMIError as e:
-                    if e.comp == pymqi.CMQC.MQCC_FAILED and e.reason == pymqi.CMQC.MQRC_SELECTOR_ERROR:
-                        # Some queues do not support all attributes
-                        return None
-                    raise
-                
-        except pymqi.MQMIError as e:
-            if e.comp == pymqi.CMQC.MQCC_FAILED and e.reason == pymqi.CMQC.MQRC_UNKNOWN_OBJECT_NAME:
-                return None
-            logging.error(f"Error getting queue status {queue_pattern}: {e}")
-            return None
+                    error_msg = f"Error getting queue list for pattern {queue_pattern}: {e}"
+                    logging.error(error_msg)
+                    # Print to console only if it's not a system queue pattern
+                    if not queue_pattern.startswith('SYSTEM.'):
+                        self._write_console(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
+            
+            return qmgr_status, channels_status, queues_status
+            
         except Exception as e:
-            logging.error(f"Unexpected error getting queue status {queue_pattern}: {e}")
+            error_msg = f"Error monitoring Queue Manager {qm_name} on server {server_name}: {e}"
+            logging.error(error_msg)
+            logging.debug("Queue Manager monitoring error traceback", exc_info=True)
+            self._write_console(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
+            
+            # Connection state is unknown after an error, do not keep it for reuse
+            if conn is not None:
+                self._discard_connection(qm_server_config)
             return None
 
+    def _write_console(self, line):
+        """Writes one console line under the output lock, so it is not spliced into another thread's output."""
+        with self._output_lock:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
     def monitor_server(self, server_config):
         """Monitors MQ server according to configuration."""
         server_name = server_config["name"]
-        print(f"{Fore.CYAN}Monitoring server {server_name}...{Style.RESET_ALL}")
+        self._write_console(f"{Fore.CYAN}Monitoring server {server_name}...{Style.RESET_ALL}")
         logging.info(f"Connecting to server {server_name}...")
         
         # Get list of Queue Managers to monitor
@@ -700,123 +1158,29 @@ class MQMonitor:
             
         logging.info(f"Found {len(queue_managers)} Queue Managers to monitor on server {server_name}")
         
-        for qm_config in queue_managers:
-            qm_name = qm_config["name"]
-            logging.info(f"Monitoring Queue Manager {qm_name} on server {server_name}")
-            
-            try:
-                # Create a copy of server config and update it with QM specific settings
-                qm_server_config = server_config.copy()
-                qm_server_config.update({
-                    "queue_manager": qm_name,
-                    "channel": qm_config["channel"],
-                    "port": qm_config.get("port", server_config.get("port", 1414)),
-                    "user": qm_config.get("user"),
-                    "password": qm_config.get("password"),
-                    "ssl": qm_config.get("ssl", False),
-                    "ssl_config": qm_config.get("ssl_config", {})
-                })
-                
-                qmgr = self.connect_to_qm(qm_server_config)
-                logging.info(f"Successfully connected to Queue Manager {qm_name} on server {server_name}")
-                
-                # Get Queue Manager status
-                qmgr_status = self.get_queue_manager_status(qmgr, qm_name)
-                logging.info(f"Got Queue Manager status: {qmgr_status['name']}, status: {qmgr_status['status']}")
-                
-                # Monitor channels
-                channels_status = []
-                pcf = pymqi.PCFExecute(qmgr)
-                
-                # Get channel list according to QM specific configuration
-                channels_to_monitor = qm_config.get('channels_to_monitor', ['*'])
-                logging.debug(f"Monitoring channels with patterns: {channels_to_monitor}")
-                for channel_pattern in channels_to_monitor:
-                    try:
-                        args = {pymqi.CMQCFC.MQCACH_CHANNEL_NAME: channel_pattern.encode()}
-                        channels = pcf.MQCMD_INQUIRE_CHANNEL(args)
-                        
-                        for channel_info in channels:
-                            channel_name = channel_info[pymqi.CMQCFC.MQCACH_CHANNEL_NAME].strip()
-                            channel = self.get_channel_status(qmgr, channel_name)
-                            if channel:
-                                status = self.check_channel_status(channel["name"], channel)
-                                channel["check_status"] = status
-                                channels_status.append(channel)
-                                
-                                # Log channel status only for non-system channels or if debug is enabled
-                                if not channel['name'].startswith('SYSTEM.') or logging.getLogger().getEffectiveLevel() == logging.DEBUG:
-                                    log_msg = f"Channel: {channel['name']}, Status: {channel['status']}, Check Status: {status['status']}"
-                                    if status['messages']:
-                                        log_msg += f", Messages: {', '.join(status['messages'])}"
-                                    logging.info(log_msg)
-                    except pymqi.MQMIError as e:
-                        error_msg = f"Error getting channel list for pattern {channel_pattern}: {e}"
-                        logging.error(error_msg)
-                        # Print to console only if it's not a system channel pattern
-                        if not channel_pattern.startswith('SYSTEM.'):
-                            print(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
-                
-                # Monitor queues
-                queues_status = []
-                
-                # Get queue list according to QM specific configuration
-                queues_to_monitor = qm_config.get('queues_to_monitor', ['*'])
-                logging.debug(f"Monitoring queues with patterns: {queues_to_monitor}")
-                for queue_pattern in queues_to_monitor:
-                    try:
-                        args = {pymqi.CMQC.MQCA_Q_NAME: queue_pattern.encode()}
-                        queues = pcf.MQCMD_INQUIRE_Q(args)
-                        
-                        for queue_info in queues:
-                            queue_name = queue_info[pymqi.CMQC.MQCA_Q_NAME].strip()
-                            # Skip system queues if not explicitly requested
-                            if queue_name.startswith(b'SYSTEM.') and not queue_name.startswith(b'SYSTEM.ADMIN'):
-                                continue
-                            
-                            queue = self.get_queue_status(qmgr, queue_name)
-                            if queue:
-                                status = self.check_queue_status(queue["name"], queue)
-                                queue["check_status"] = status
-                                queues_status.append(queue)
-                                
-                                # Log queue status only for non-system queues or if debug is enabled
-                                if not queue['name'].startswith('SYSTEM.') or logging.getLogger().getEffectiveLevel() == logging.DEBUG:
-                                    log_msg = f"Queue: {queue['name']}, Type: {queue['type']}, Depth: {queue['depth']}/{queue['max_depth']} ({queue['depth_percent']:.1f}%), Consumers: {queue['open_input']}, Status: {status['status']}"
-                                    if status['messages']:
-                                        log_msg += f", Messages: {', '.join(status['messages'])}"
-                                    logging.info(log_msg)
-                    except pymqi.MQMIError as e:
-                        error_msg = f"Error getting queue list for pattern {queue_pattern}: {e}"
-                        logging.error(error_msg)
-                        # Print to console only if it's not a system queue pattern
-                        if not queue_pattern.startswith('SYSTEM.'):
-                            print(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
-                
-                # Generate output for this Queue Manager
-                logging.info(f"Generating output for Queue Manager {qm_name} on server {server_name}")
-                self.format_and_send_output(server_name, qmgr_status, channels_status, queues_status)
-                
-            except Exception as e:
-                error_msg = f"Error monitoring Queue Manager {qm_name} on server {server_name}: {e}"
-                logging.error(error_msg, exc_info=True)
-                print(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
-            
-            finally:
-                if 'qmgr' in locals():
-                    try:
-                        qmgr.disconnect()
-                        logging.info(f"Disconnected from Queue Manager {qm_name} on server {server_name}")
-                    except Exception as e:
-                        logging.error(f"Error disconnecting from Queue Manager {qm_name} on server {server_name}: {e}")
-                        
+        # Queue Managers of one server are monitored concurrently
+        if len(queue_managers) > 1:
+            with ThreadPoolExecutor(max_workers=len(queue_managers)) as executor:
+                results = list(executor.map(lambda qm_config: self._monitor_one_qm(server_config, qm_config),
+                                            queue_managers))
+        else:
+            results = [self._monitor_one_qm(server_config, queue_managers[0])]
+        
+        # Generate output in configured Queue Manager order
+        for qm_config, result in zip(queue_managers, results):
+            if result is not None:
+                logging.info(f"Generating output for Queue Manager {qm_config['name']} on server {server_name}")
+                self.format_and_send_output(server_name, *result)
+        
         logging.info(f"Finished monitoring all Queue Managers on server {server_name}")
 
     def format_and_send_output(self, server_name, qmgr_status, channels_status, queues_status):
         """Formats and sends output according to configuration."""
         output_format = self.config["output"]["format"]
-        colored = self.config["output"].get("colored", True)
+        # Colors would only be stripped again by colorama when stdout is not a terminal
+        colored = self.config["output"].get("colored", True) and _STDOUT_IS_TTY
         
+        console_lines = None
         if output_format == "json":
             output = self.format_json_output(server_name, qmgr_status, channels_status, queues_status)
         elif output_format == "csv":
@@ -824,99 +1188,136 @@ class MQMonitor:
         elif output_format == "table":
             output = self.format_table_output(server_name, qmgr_status, channels_status, queues_status)
         else:  # simple line format
-            output = self.format_console_output(server_name, qmgr_status, channels_status, queues_status, colored)
-        
-        print(output)
+            # Lines are formatted once, colors are added only for console
+            console_lines, statuses = self.format_console_lines(server_name, qmgr_status, channels_status, queues_status)
+            output = self.colorize_lines(console_lines, statuses) if colored else "\n".join(console_lines)
         
-        # Write to log
-        if "log_file" in self.config["output"]:
-            with open(self.config["output"]["log_file"], "a") as f:
-                f.write(output + "\n\n")
-        
-        # Write monitoring results to log, if logging is enabled
+        # Non-colored lines for log, if logging is enabled
+        log_lines = None
         logging_config = self.config["output"].get("logging", {})
         if logging_config.get("enabled", False):
-            # Create non-colored version of output for log
-            if output_format not in ["json", "csv"]:
-                log_output = self.format_console_output(server_name, qmgr_status, channels_status, queues_status, colored=False)
+            if output_format in ["json", "csv"]:
+                log_lines = output.split('\n')
+            elif console_lines is not None:
+                log_lines = console_lines
             else:
-                log_output = output
+                log_lines, _ = self.format_console_lines(server_name, qmgr_status, channels_status, queues_status)
+        
+        # Servers are monitored in parallel, keep output of one Queue Manager together
+        with self._output_lock:
+            # Whole output of Queue Manager in one write
+            sys.stdout.write(output + "\n")
+            sys.stdout.flush()
             
-            # Split output into lines and write to log
-            for line in log_output.split('\n'):
-                if line.strip():  # Skip empty lines
-                    logging.info(line)
+            # Write to log
+            if self._log_fh is not None:
+                self._log_fh.write(output + "\n\n")
+                self._log_fh.flush()
             
-            # Add separator for better readability
-            logging.info("=" * 80)
+            # Write monitoring results to log
+            if log_lines is not None:
+                for line in log_lines:
+                    if line.strip():  # Skip empty lines
+                        logging.info(line)
+                
+                # Add separator for better readability
+                logging.info("=" * 80)
 
-    def format_console_output(self, server_name, qmgr_status, channels_status, queues_status, colored=True):
-        """Formats output for console in new format."""
-        output = []
-        current_time = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+    def format_console_lines(self, server_name, qmgr_status, channels_status, queues_status):
+        """Formats uncolored console lines, returns them with status of each line."""
+        lines = []
+        statuses = []
+        current_time = self._now_str()[0]
+        qm_name = qmgr_status['name']
+        qm_status = qmgr_status['status']
         
         # Queue Manager output
-        qm_status_text = f"{current_time} - {qmgr_status['status']} - QueueManagerState - "
-        qm_status_text += f"IBM MQ Queue Manager {qmgr_status['name']} is {qmgr_status['status'].lower()} on {server_name}"
-        output.append(self.colorize_line(qm_status_text, qmgr_status['status'], colored))
+        lines.append(f"{current_time} - {qm_status} - QueueManagerState - "
+                     f"IBM MQ Queue Manager {qm_name} is {qm_status.lower()} on {server_name}")
+        statuses.append(qm_status)
         
         # Channels output
         if channels_status:
             for channel in channels_status:
                 # Skip system channels unless explicitly requested
-                if channel['name'].startswith('SYSTEM.') and not channel['name'].startswith('SYSTEM.ADMIN'):
+                if not channel['show']:
                     continue
                 
-                channel_text = f"{current_time} - {channel['check_status']['status']} - ChannelState - "
-                channel_text += f"Channel {channel['name']} is {channel['status'].lower()} on {qmgr_status['name']}"
-                if channel['check_status'].get('messages'):
-                    channel_text += f" ({', '.join(channel['check_status']['messages'])})"
-                output.append(self.colorize_line(channel_text, channel['check_status']['status'], colored))
+                check_status = channel['check_status']
+                channel_text = (f"{current_time} - {check_status['status']} - ChannelState - "
+                                f"Channel {channel['name']} is {channel['status'].lower()} on {qm_name}")
+                if check_status.get('messages'):
+                    channel_text += f" ({', '.join(check_status['messages'])})"
+                lines.append(channel_text)
+                statuses.append(check_status['status'])
         
         # Queues output
         if queues_status:
+            # Hidden system queues are already dropped by get_queues_bulk
             for queue in queues_status:
-                # Skip system queues unless explicitly requested
-                if queue['name'].startswith('SYSTEM.') and not queue['name'].startswith('SYSTEM.ADMIN'):
-                    continue
-                
-                queue_status = queue['check_status']['status']
-                queue_text = f"{current_time} - {queue_status} - QueueState - "
-                queue_text += f"Queue {queue['name']} on {qmgr_status['name']} - "
-                queue_text += f"depth: {queue['depth']}/{queue['max_depth']} ({queue['depth_percent']:.1f}%), "
-                queue_text += f"consumers: {queue['open_input']}"
-                if queue['check_status'].get('messages'):
-                    queue_text += f" ({', '.join(queue['check_status']['messages'])})"
-                output.append(self.colorize_line(queue_text, queue_status, colored))
+                queue_status = queue.check_status['status']
+                queue_text = (f"{current_time} - {queue_status} - QueueState - "
+                              f"Queue {queue.name} on {qm_name} - "
+                              f"depth: {queue.depth}/{queue.max_depth} ({queue.depth_percent:.1f}%), "
+                              f"consumers: {queue.open_input}")
+                if queue.check_status.get('messages'):
+                    queue_text += f" ({', '.join(queue.check_status['messages'])})"
+                lines.append(queue_text)
+                statuses.append(queue_status)
         
-        return "\n".join(output)
+        return lines, statuses
+
+    def _now_str(self):
+        """Returns current time formatted for console and JSON output, reused within one second."""
+        second = int(time.time())
+        cached = self._now_cache
+        if cached is None or cached[0] != second:
+            now = datetime.now()
+            cached = self._now_cache = (second, now.strftime("%d-%m-%Y %H:%M:%S"), now.isoformat())
+        return cached[1:]
+
+    def format_console_output(self, server_name, qmgr_status, channels_status, queues_status, colored=True):
+        """Formats output for console in new format."""
+        lines, statuses = self.format_console_lines(server_name, qmgr_status, channels_status, queues_status)
+        if not colored:
+            return "\n".join(lines)
+        return self.colorize_lines(lines, statuses)
 
     def colorize_line(self, text, status, colored=True):
         """Colors the entire line according to status."""
         if not colored:
             return text
         
-        if status == STATUS_OK:
-            return f"{Fore.GREEN}{text}{Style.RESET_ALL}"
-        elif status == STATUS_WARNING:
-            return f"{Fore.YELLOW}{text}{Style.RESET_ALL}"
-        elif status == STATUS_CRITICAL:
-            return f"{Fore.RED}{text}{Style.RESET_ALL}"
-        else:
-            return f"{Fore.WHITE}{text}{Style.RESET_ALL}"
+        return f"{_STATUS_COLOR_GET(status, Fore.WHITE)}{text}{Style.RESET_ALL}"
+
+    def colorize_lines(self, lines, statuses):
+        """Colors lines according to their statuses and joins them."""
+        color_get = _STATUS_COLOR_GET
+        default_color = Fore.WHITE
+        reset = Style.RESET_ALL
+        return "\n".join(f"{color_get(status, default_color)}{line}{reset}" for line, status in zip(lines, statuses))
 
     def format_json_output(self, server_name, qmgr_status, channels_status, queues_status):
         """Formats output to JSON format."""
-        return json.dumps({
+        payload = {
             "server": server_name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_str()[1],
             "queue_manager": qmgr_status,
-            "channels": channels_status,
-            "queues": queues_status
-        }, indent=2)
+            "channels": [
+                {key: value for key, value in channel.items() if key not in _INTERNAL_CHANNEL_KEYS}
+                for channel in channels_status
+            ],
+            "queues": [queue.to_dict() for queue in queues_status]
+        }
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(payload, indent=2)
 
     def format_table_output(self, server_name, qmgr_status, channels_status, queues_status):
         """Formátuje výstup do tabulkového formátu."""
+        # tabulate is only needed for table output
+        from tabulate import tabulate
+        
         output = []
         
         # Hlavička serveru
@@ -938,17 +1339,14 @@ class MQMonitor:
         if channels_status:
             output.append("Channels:")
             ch_headers = ["NAME", "TYPE", "STATUS", "MESSAGES", "LAST MSG TIME", "CHECK STATUS"]
-            ch_data = []
-            for channel in channels_status:
-                if not channel['name'].startswith('SYSTEM.') or channel['name'].startswith('SYSTEM.ADMIN'):
-                    ch_data.append([
-                        channel['name'],
-                        channel.get('type', 'Unknown'),
-                        channel['status'],
-                        channel.get('messages', 0),
-                        channel.get('last_msg_time', 'Never'),
-                        channel['check_status']['status']
-                    ])
+            ch_data = [[
+                channel['name'],
+                channel.get('type', 'Unknown'),
+                channel['status'],
+                channel.get('messages', 0),
+                channel.get('last_msg_time', 'Never'),
+                channel['check_status']['status']
+            ] for channel in channels_status if channel['show']]
             output.append(tabulate(ch_data, headers=ch_headers, tablefmt='grid'))
             output.append("")
         
@@ -956,28 +1354,21 @@ class MQMonitor:
         if queues_status:
             output.append("Queues:")
             q_headers = ["NAME", "TYPE", "DEPTH", "%FULL", "CONSUMERS", "CHECK STATUS", "MESSAGES"]
-            q_data = []
-            for queue in queues_status:
-                if not queue['name'].startswith('SYSTEM.') or queue['name'].startswith('SYSTEM.ADMIN'):
-                    messages = ', '.join(queue['check_status'].get('messages', [])) if queue['check_status'].get('messages') else ''
-                    q_data.append([
-                        queue['name'],
-                        queue['type'],
-                        f"{queue['depth']}/{queue['max_depth']}",
-                        f"{queue['depth_percent']:.1f}%",
-                        f"{queue['open_input']}/1",
-                        queue['check_status']['status'],
-                        messages
-                    ])
+            q_data = [[
+                queue.name,
+                queue.type,
+                f"{queue.depth}/{queue.max_depth}",
+                f"{queue.depth_percent:.1f}%",
+                f"{queue.open_input}/1",
+                queue.check_status['status'],
+                ', '.join(queue.check_status['messages'])
+            ] for queue in queues_status]
             output.append(tabulate(q_data, headers=q_headers, tablefmt='grid'))
         
         return "\n".join(output)
 
     def format_csv_output(self, server_name, qmgr_status, channels_status, queues_status):
         """Formátuje výstup do CSV formátu."""
-        import csv
-        from io import StringIO
-        
         output = StringIO()
         writer = csv.writer(output)
         
@@ -990,49 +1381,124 @@ class MQMonitor:
         if channels_status:
             writer.writerow([])
             writer.writerow(["Type", "Name", "Status", "Messages", "Last Message Time", "Check Status", "Check Messages"])
-            for channel in channels_status:
-                if not channel['name'].startswith('SYSTEM.') or channel['name'].startswith('SYSTEM.ADMIN'):
-                    writer.writerow([
-                        "Channel",
-                        channel['name'],
-                        channel['status'],
-                        channel.get('messages', 0),
-                        channel.get('last_msg_time', 'Never'),
-                        channel['check_status']['status'],
-                        '; '.join(channel['check_status'].get('messages', []))
-                    ])
+            writer.writerows([
+                "Channel",
+                channel['name'],
+                channel['status'],
+                channel.get('messages', 0),
+                channel.get('last_msg_time', 'Never'),
+                channel['check_status']['status'],
+                '; '.join(channel['check_status'].get('messages', []))
+            ] for channel in channels_status if channel['show'])
         
         # Queues info
         if queues_status:
             writer.writerow([])
             writer.writerow(["Type", "Name", "Queue Type", "Depth", "Max Depth", "Depth %", "Consumers", "Check Status", "Check Messages"])
-            for queue in queues_status:
-                if not queue['name'].startswith('SYSTEM.') or queue['name'].startswith('SYSTEM.ADMIN'):
-                    writer.writerow([
-                        "Queue",
-                        queue['name'],
-                        queue['type'],
-                        queue['depth'],
-                        queue['max_depth'],
-                        f"{queue['depth_percent']:.1f}",
-                        queue['open_input'],
-                        queue['check_status']['status'],
-                        '; '.join(queue['check_status'].get('messages', []))
-                    ])
+            writer.writerows([
+                "Queue",
+                queue.name,
+                queue.type,
+                queue.depth,
+                queue.max_depth,
+                f"{queue.depth_percent:.1f}",
+                queue.open_input,
+                queue.check_status['status'],
+                '; '.join(queue.check_status.get('messages', []))
+            ] for queue in queues_status)
         
         return output.getvalue()
 
+def load_config(path):
+    """Loads YAML config, reusing a JSON cache while the YAML file is unchanged."""
+    cache_path = path + '.cache.json'
+    try:
+        if os.stat(cache_path).st_mtime >= os.stat(path).st_mtime:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        # No usable cache, parse YAML below
+        pass
+
+    # PyYAML is only needed when the cache is missing or outdated
+    import yaml
+    # Prefer the libyaml-backed C loader, fall back to the pure-Python one
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+    
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=YamlLoader)
+
+    # Write cache atomically, failure only means YAML gets parsed next time too
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', delete=False,
+                                         dir=os.path.dirname(os.path.abspath(cache_path)),
+                                         suffix='.tmp') as tmp:
+            tmp_name = tmp.name
+            json.dump(config, tmp)
+        os.replace(tmp_name, cache_path)
+    except (OSError, TypeError, ValueError):
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+    return config
+
+# Required config fields and their types, checked by validate_config
+REQUIRED_SECTIONS = {
+    "mq_servers": list,
+    "output": dict,
+    "channels_monitoring": dict,
+    "queues_monitoring": dict
+}
+
+REQUIRED_SERVER_FIELDS = {
+    "name": str,
+    "host": str,
+    "port": int,  # Port is required at server level
+    "queue_managers": list
+}
+
+REQUIRED_QM_FIELDS = {
+    "name": str,
+    "channel": str
+}
+
+REQUIRED_CHANNEL_FIELDS = {
+    "required_status": str,
+    "inactive_warning": bool,
+    "max_connections": int,
+    "warning_connections": int
+}
+
+REQUIRED_QUEUE_FIELDS = {
+    "max_depth": int,
+    "warning_depth": int,
+    "max_depth_percent": int,
+    "warning_depth_percent": int,
+    "stuck_queue_warning": bool,
+    "required_consumers": int
+}
+
+OUTPUT_FORMATS = ("console", "json", "csv", "table")
+
+def check_required_fields(section, required_fields, where):
+    """Checks that section contains all required fields with correct types."""
+    for field, field_type in required_fields.items():
+        if field not in section:
+            raise ValueError(f"Missing required field '{field}' in {where}")
+        if not isinstance(section[field], field_type):
+            raise ValueError(f"Field '{field}' has wrong type in {where}")
+
 def validate_config(config):
     """Validates config file and checks all required mappings."""
-    required_fields = {
-        "mq_servers": list,
-        "output": dict,
-        "channels_monitoring": dict,
-        "queues_monitoring": dict
-    }
-
     # Check basic structure
-    for field, field_type in required_fields.items():
+    for field, field_type in REQUIRED_SECTIONS.items():
         if field not in config:
             raise ValueError(f"Missing required section '{field}' in config file")
         if not isinstance(config[field], field_type):
@@ -1042,76 +1508,32 @@ def validate_config(config):
     output_config = config["output"]
     if "format" not in output_config:
         raise ValueError("Missing required field 'format' in output section")
-    if output_config["format"] not in ["console", "json", "csv", "table"]:
-        raise ValueError("Invalid output format, allowed values are: console, json, csv, table")
+    if output_config["format"] not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output format, allowed values are: {', '.join(OUTPUT_FORMATS)}")
 
     # Check server configuration
     for server in config["mq_servers"]:
-        required_server_fields = {
-            "name": str,
-            "host": str,
-            "port": int,  # Port is required at server level
-            "queue_managers": list
-        }
-        for field, field_type in required_server_fields.items():
-            if field not in server:
-                raise ValueError(f"Missing required field '{field}' in server configuration {server.get('name', 'UNKNOWN')}")
-            if not isinstance(server[field], field_type):
-                raise ValueError(f"Field '{field}' has wrong type in server configuration {server.get('name', 'UNKNOWN')}")
+        server_name = server.get('name', 'UNKNOWN')
+        check_required_fields(server, REQUIRED_SERVER_FIELDS, f"server configuration {server_name}")
         
         # Validate Queue Manager configurations
         for qm in server["queue_managers"]:
-            required_qm_fields = {
-                "name": str,
-                "channel": str
-            }
-            for field, field_type in required_qm_fields.items():
-                if field not in qm:
-                    raise ValueError(f"Missing required field '{field}' in Queue Manager configuration for server {server.get('name', 'UNKNOWN')}")
-                if not isinstance(qm[field], field_type):
-                    raise ValueError(f"Field '{field}' has wrong type in Queue Manager configuration for server {server.get('name', 'UNKNOWN')}")
-                
+            check_required_fields(qm, REQUIRED_QM_FIELDS, f"Queue Manager configuration for server {server_name}")
+            
             # Check port if specified at QM level
             if "port" in qm and not isinstance(qm["port"], int):
-                raise ValueError(f"Field 'port' has wrong type in Queue Manager configuration for server {server.get('name', 'UNKNOWN')}")
+                raise ValueError(f"Field 'port' has wrong type in Queue Manager configuration for server {server_name}")
 
-    # Check channel monitoring
+    # Check channel and queue monitoring
     channels_config = config["channels_monitoring"]
     if "global" not in channels_config:
         raise ValueError("Missing 'global' section in channel monitoring configuration")
-    
-    required_channel_fields = {
-        "required_status": str,
-        "inactive_warning": bool,
-        "max_connections": int,
-        "warning_connections": int
-    }
-    
-    for field, field_type in required_channel_fields.items():
-        if field not in channels_config["global"]:
-            raise ValueError(f"Missing required field '{field}' in global channel configuration")
-        if not isinstance(channels_config["global"][field], field_type):
-            raise ValueError(f"Field '{field}' has wrong type in global channel configuration")
+    check_required_fields(channels_config["global"], REQUIRED_CHANNEL_FIELDS, "global channel configuration")
 
-    # Check queue monitoring
     queues_config = config["queues_monitoring"]
     if "global" not in queues_config:
         raise ValueError("Missing 'global' section in queue monitoring configuration")
-    
-    required_queue_fields = {
-        "max_depth": int,
-        "warning_depth": int,
-        "max_depth_percent": int,
-        "warning_depth_percent": int,
-        "stuck_queue_warning": bool,
-        "required_consumers": int
-    }
-    
-    for field, field_type in required_queue_fields.items():
-        if field not in queues_config["global"]:
-            raise ValueError(f"Missing required field '{field}' in global queue configuration")
-        if not isinstance(queues_config["global"][field], field_type):
-            raise ValueError(f"Field '{field}' has wrong type in global queue configuration")
+    check_required_fields(queues_config["global"], REQUIRED_QUEUE_FIELDS, "global queue configuration")
 
     # Check message configuration
     for monitoring in [channels_config, queues_config]:
@@ -1126,6 +1548,16 @@ def validate_config(config):
 
     return True
 
+def positive_int(value):
+    """Argparse type for a whole number greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: '{value}'")
+    return number
+
 def main():
     """Main function of the program."""
     parser = argparse.ArgumentParser(description="IBM MQ Monitoring Script v2")
@@ -1136,6 +1568,8 @@ def main():
                       help="Output format")
     parser.add_argument("-v", "--verbose", action="store_true", 
                       help="Show detailed output")
+    parser.add_argument("-i", "--interval", type=positive_int, 
+                      help="Repeat monitoring every INTERVAL seconds, keeping connections open")
     args = parser.parse_args()
     
     # Basic logging setup (will be overwritten after loading config)
@@ -1145,8 +1579,7 @@ def main():
         logging.basicConfig(level=logging.INFO)
     
     try:
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(args.config)
             
         # Validate config
         try:
@@ -1190,19 +1623,36 @@ def main():
             sys.exit(1)
         logging.info(f"Monitoring only server: {args.server}")
     
-    # Monitor servers
-    start_time = time.time()
+    # Monitor servers (repeatedly with --interval, pooled connections stay open between cycles)
     print(f"{Fore.CYAN}Starting IBM MQ server monitoring...{Style.RESET_ALL}")
-    for server in servers:
-        monitor.monitor_server(server)
-    end_time = time.time()
-    
-    # Log end of monitoring
-    duration = end_time - start_time
-    logging.info("=" * 80)
-    logging.info(f"END MONITORING - Duration: {duration:.2f} seconds")
-    logging.info("=" * 80)
-    print(f"{Fore.GREEN}Monitoring completed in {duration:.2f} seconds{Style.RESET_ALL}")
+    # Servers are monitored concurrently, so connection handshakes overlap
+    max_parallel = min(config.get('global', {}).get('max_parallel_servers', 16), len(servers))
+    try:
+        while True:
+            start_time = time.time()
+            if max_parallel > 1:
+                with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                    list(executor.map(monitor.monitor_server, servers))
+            else:
+                for server in servers:
+                    monitor.monitor_server(server)
+            end_time = time.time()
+            
+            # Log end of monitoring
+            duration = end_time - start_time
+            logging.info("=" * 80)
+            logging.info(f"END MONITORING - Duration: {duration:.2f} seconds")
+            logging.info("=" * 80)
+            print(f"{Fore.GREEN}Monitoring completed in {duration:.2f} seconds{Style.RESET_ALL}")
+            
+            if not args.interval:
+                break
+            time.sleep(max(0, args.interval - duration))
+    except KeyboardInterrupt:
+        logging.info("Monitoring interrupted by user")
+        print(f"{Fore.YELLOW}Monitoring stopped{Style.RESET_ALL}")
+    finally:
+        monitor.close_all()
 
 if __name__ == "__main__":
     main() 
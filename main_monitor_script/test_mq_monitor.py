@@ -0,0 +1,261 @@
+"""
+Tests for mq_monitor.py that run without an IBM MQ installation.
+
+A minimal stand-in for pymqi is registered before mq_monitor is imported, so
+Queue Manager connections and PCF inquiries are answered in memory.
+
+Run with: python -m unittest test_mq_monitor
+"""
+
+import io
+import os
+import sys
+import json
+import tempfile
+import threading
+import itertools
+import unittest
+from contextlib import redirect_stdout
+from types import ModuleType
+from unittest import mock
+
+
+class _Constants:
+    """Any MQ constant name resolves to its own distinct integer."""
+    def __init__(self):
+        self._values = {}
+        self._next = itertools.count(1)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        value = self._values.get(name)
+        if value is None:
+            value = self._values[name] = next(self._next)
+        return value
+
+
+class _MQMIError(Exception):
+    def __init__(self, comp, reason):
+        super().__init__(f"MQI Error. Comp: {comp}, Reason {reason}")
+        self.comp = comp
+        self.reason = reason
+
+
+class _Filter:
+    def __init__(self, selector):
+        self.selector = selector
+
+    def not_like(self, value):
+        return (self.selector, 'not_like', value)
+
+
+class _QueueManager:
+    """Connection handle that, like MQCONNX, is bound to its thread unless shared."""
+    connects = []
+
+    def __init__(self, name):
+        self.owner = None
+        self.shared = False
+        self.disconnected = False
+        self.sco = None
+
+    def connectWithOptions(self, name, cd=None, sco=None, opts=0):
+        cmqc = _pymqi.CMQC
+        self.owner = threading.get_ident()
+        self.sco = sco
+        self.shared = opts in (cmqc.MQCNO_HANDLE_SHARE_BLOCK, cmqc.MQCNO_HANDLE_SHARE_NO_BLOCK)
+        _QueueManager.connects.append(self)
+
+    def use(self):
+        if not self.shared and threading.get_ident() != self.owner:
+            raise _MQMIError(_pymqi.CMQC.MQCC_FAILED, _pymqi.CMQC.MQRC_HCONN_ERROR)
+
+    def inquire(self, attribute):
+        self.use()
+        return b'QM1'
+
+    def disconnect(self):
+        self.use()
+        self.disconnected = True
+
+
+class _PCFExecute:
+    def __init__(self, qmgr):
+        self.qmgr = qmgr
+
+    def MQCMD_INQUIRE_Q_MGR(self, args):
+        self.qmgr.use()
+        return [{}]
+
+    def MQCMD_INQUIRE_CHANNEL(self, args):
+        self.qmgr.use()
+        return []
+
+    def MQCMD_INQUIRE_CHANNEL_STATUS(self, args):
+        self.qmgr.use()
+        return []
+
+    def MQCMD_INQUIRE_Q(self, args, filters=None):
+        self.qmgr.use()
+        return []
+
+    def disconnect(self):
+        pass
+
+
+_pymqi = ModuleType('pymqi')
+_pymqi.CMQC = _Constants()
+_pymqi.CMQCFC = _Constants()
+_pymqi.MQMIError = _MQMIError
+_pymqi.Filter = _Filter
+_pymqi.QueueManager = _QueueManager
+_pymqi.PCFExecute = _PCFExecute
+_pymqi.CD = type('CD', (), {})
+_pymqi.SCO = type('SCO', (), {})
+sys.modules['pymqi'] = _pymqi
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import mq_monitor  # noqa: E402
+
+
+def _config(servers):
+    return {
+        "global": {"max_parallel_servers": 4},
+        "mq_servers": [
+            {"name": name, "host": "localhost", "port": 1414,
+             "queue_managers": [{"name": f"QM_{name}", "channel": "SYSTEM.DEF.SVRCONN"}]}
+            for name in servers
+        ],
+        "output": {"format": "json"},
+        "channels_monitoring": {"global": {
+            "required_status": "RUNNING", "inactive_warning": False,
+            "max_connections": 100, "warning_connections": 80
+        }},
+        "queues_monitoring": {"global": {
+            "max_depth": 1000, "warning_depth": 800, "max_depth_percent": 90,
+            "warning_depth_percent": 80, "stuck_queue_warning": False, "required_consumers": 0
+        }},
+    }
+
+
+class IntervalModeTest(unittest.TestCase):
+    def setUp(self):
+        _QueueManager.connects = []
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmpdir.name, 'config.yaml')
+        with open(self.config_path, 'w') as f:
+            # JSON is valid YAML
+            json.dump(_config(["SRV1", "SRV2"]), f)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_cycles(self, cycles):
+        """Run main() with --interval until it has monitored all servers cycles times."""
+        sleeps = [None] * (cycles - 1) + [KeyboardInterrupt()]
+        argv = ['mq_monitor.py', '-c', self.config_path, '-i', '1']
+        with mock.patch.object(sys, 'argv', argv), \
+             mock.patch.object(mq_monitor.time, 'sleep', side_effect=sleeps), \
+             redirect_stdout(io.StringIO()) as stdout:
+            mq_monitor.main()
+        return stdout.getvalue()
+
+    def test_later_cycles_reuse_connections(self):
+        output = self.run_cycles(3)
+
+        # One connect per Queue Manager, cycles 2 and 3 run in new worker threads on the same handles
+        self.assertEqual(len(_QueueManager.connects), 2)
+        self.assertTrue(all(qmgr.shared for qmgr in _QueueManager.connects))
+        self.assertEqual(output.count("Monitoring completed"), 3)
+        self.assertNotIn("Error monitoring Queue Manager", output)
+
+        # Pooled handles are closed once, from the main thread, when the loop ends
+        self.assertTrue(all(qmgr.disconnected for qmgr in _QueueManager.connects))
+
+    def test_interval_must_be_positive(self):
+        for value in ('0', '-5'):
+            argv = ['mq_monitor.py', '-c', self.config_path, '-i', value]
+            with mock.patch.object(sys, 'argv', argv), \
+                 mock.patch.object(sys, 'stderr', io.StringIO()) as stderr, \
+                 self.assertRaises(SystemExit):
+                mq_monitor.main()
+            self.assertIn("must be greater than 0", stderr.getvalue())
+        self.assertEqual(_QueueManager.connects, [])
+
+
+class _ScriptedPCF:
+    """PCFExecute whose filtered queue inquiry fails with a given reason code."""
+    def __init__(self, reason):
+        self.reason = reason
+        self.inquiries = []
+
+    def MQCMD_INQUIRE_Q(self, args, filters=None):
+        self.inquiries.append(filters)
+        if filters:
+            raise _MQMIError(_pymqi.CMQC.MQCC_FAILED, self.reason)
+        return []
+
+
+class QueueFilterFallbackTest(unittest.TestCase):
+    def setUp(self):
+        self.monitor = mq_monitor.MQMonitor(_config(["SRV1"]))
+        self.conn = mq_monitor.PooledConnection(_QueueManager(None))
+
+    def test_rejected_filter_falls_back_for_this_connection(self):
+        self.conn.pcf = _ScriptedPCF(_pymqi.CMQCFC.MQRCCF_FILTER_ERROR)
+        self.assertEqual(self.monitor.get_queues_bulk(self.conn, b'*'), [])
+        self.assertFalse(self.conn.pcf_filters)
+
+        # The next cycle skips the filtered inquiry, other connections still use filters
+        self.monitor.get_queues_bulk(self.conn, b'*')
+        filtered, *unfiltered = self.conn.pcf.inquiries
+        self.assertIsNotNone(filtered)
+        self.assertEqual(unfiltered, [None, None])
+        self.assertTrue(mq_monitor.PooledConnection(_QueueManager(None)).pcf_filters)
+
+    def test_other_errors_are_raised(self):
+        self.conn.pcf = _ScriptedPCF(_pymqi.CMQC.MQRC_CONNECTION_BROKEN)
+        with self.assertRaises(_MQMIError):
+            self.monitor.get_queues_bulk(self.conn, b'*')
+        self.assertTrue(self.conn.pcf_filters)
+
+
+class SslKeyRepositoryTest(unittest.TestCase):
+    def test_key_repository_is_set_per_connection(self):
+        monitor = mq_monitor.MQMonitor(_config(["SRV1", "SRV2"]))
+        configs = [{"name": name, "host": "localhost", "port": 1414, "queue_manager": f"QM_{name}",
+                    "channel": "SYSTEM.DEF.SVRCONN", "ssl": True,
+                    "ssl_config": {"cipher_spec": "TLS_RSA_WITH_AES_256_CBC_SHA256",
+                                   "key_repository": f"/var/mqm/ssl/{name}"}}
+                   for name in ("SRV1", "SRV2")]
+        with mock.patch.dict(os.environ):
+            os.environ.pop('MQSSLKEYR', None)
+            qmgrs = [monitor.connect_to_qm(config) for config in configs]
+            self.assertNotIn('MQSSLKEYR', os.environ)
+
+        self.assertEqual([qmgr.sco.KeyRepository for qmgr in qmgrs],
+                         [b'/var/mqm/ssl/SRV1', b'/var/mqm/ssl/SRV2'])
+
+
+class JsonOutputTest(unittest.TestCase):
+    def test_internal_classification_keys_are_not_written(self):
+        monitor = mq_monitor.MQMonitor(_config(["SRV1"]))
+        check_status = {"status": mq_monitor.STATUS_OK, "messages": []}
+        channel = {"name": "APP.SVRCONN", "is_system": False, "show": True, "type": 7,
+                   "status": "RUNNING", "last_msg_time": "Never", "messages": 0,
+                   "connections": 0, "check_status": check_status}
+        queue = mq_monitor.QueueRecord("APP.QUEUE", False, "LOCAL", 1, 10, 0, 0, "", "",
+                                       "NORMAL", "PERSISTENT")
+        queue.check_status = check_status
+
+        output = json.loads(monitor.format_json_output("SRV1", {"name": "QM_SRV1"}, [channel], [queue]))
+
+        self.assertEqual(list(output["channels"][0]), ["name", "type", "status", "last_msg_time",
+                                                       "messages", "connections", "check_status"])
+        self.assertNotIn("is_system", output["queues"][0])
+        self.assertIn("is_system", channel)
+
+
+if __name__ == '__main__':
+    unittest.main()
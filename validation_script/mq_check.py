@@ -13,16 +13,128 @@ Version: 1.0.0
 
 import os
 import sys
+import json
+import tempfile
 import socket
+import selectors
+import errno
+import time
+import struct
 import platform
 import subprocess
 import argparse
 import re
-from colorama import init, Fore, Style
+import functools
+import importlib
+import contextlib
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from collections import namedtuple
 
-# Initialize colorama for colored output
-init(autoreset=True)
+# Color codes, plain until init_colors() enables colorama
+_CYAN = _GREEN = _RED = _YELLOW = _RESET = _RESET_ALL = ''
+
+@functools.lru_cache(maxsize=None)
+def lazy_import(name):
+    """Import a module on first use; returns (module, None) or (None, ImportError)."""
+    try:
+        return importlib.import_module(name), None
+    except ImportError as e:
+        return None, e
+
+def init_colors():
+    """Initialize colorama and bind the color codes used by every output line."""
+    global _CYAN, _GREEN, _RED, _YELLOW, _RESET, _RESET_ALL
+    colorama, _ = lazy_import('colorama')
+    if colorama is None:
+        return
+    colorama.init(autoreset=True)
+    Fore, Style = colorama.Fore, colorama.Style
+    _CYAN = Fore.CYAN
+    _GREEN = Fore.GREEN
+    _RED = Fore.RED
+    _YELLOW = Fore.YELLOW
+    _RESET = Fore.RESET
+    _RESET_ALL = Style.RESET_ALL
+
+def config_errors():
+    """Errors reported as a configuration problem instead of a crash."""
+    yaml, _ = lazy_import('yaml')
+    if yaml is None:
+        return (OSError, ValueError, ImportError)
+    return (OSError, ValueError, yaml.YAMLError)
+
+# Platform is fixed for the lifetime of the process
+_IS_WINDOWS = platform.system() == "Windows"
+_LIB_NAME = "mqic.dll" if _IS_WINDOWS else "libmqm.so"
+
+# Port probes: local listeners answer in well under a millisecond
+LOCAL_PROBE_TIMEOUT = 1.5
+# Reset instead of an orderly FIN handshake when a probe socket is closed
+_NO_LINGER = struct.pack('ii', 1, 0)
+# Linux only, bounds how long the kernel keeps retransmitting the SYN
+_TCP_USER_TIMEOUT = getattr(socket, 'TCP_USER_TIMEOUT', None)
+
+# MQSC commands run for every Queue Manager in a single runmqsc session
+MQSC_LSSTATUS_PORT = "DISPLAY LSSTATUS(*) PORT"
+MQSC_QMGR_PORT = "DISPLAY QMGR PORT"
+MQSC_QMGR_CHLAUTH = "DISPLAY QMGR CHLAUTH"
+MQSC_SYSTEM_QUEUE = "DISPLAY Q(SYSTEM.DEFAULT.LOCAL.QUEUE)"
+MQSC_QMGR_ALL = "DISPLAY QMGR ALL"
+MQSC_LISTENER = "DISPLAY LISTENER(*)"
+MQSC_LSSTATUS = "DISPLAY LSSTATUS(*)"
+MQSC_SVRCONN_CHANNELS = "DISPLAY CHANNEL(*) CHLTYPE WHERE(CHLTYPE EQ SVRCONN)"
+MQSC_SVRCONN_CHSTATUS = "DISPLAY CHSTATUS(*) WHERE(CHLTYPE EQ SVRCONN)"
+MQSC_ACTIVE_CHSTATUS = "DISPLAY CHSTATUS(*) WHERE(STATUS NE INACTIVE)"
+
+QMGR_MQSC_COMMANDS = [
+    MQSC_LSSTATUS_PORT,
+    MQSC_QMGR_PORT,
+    MQSC_QMGR_CHLAUTH,
+    MQSC_SYSTEM_QUEUE,
+    MQSC_QMGR_ALL,
+    MQSC_LISTENER,
+    MQSC_LSSTATUS,
+    MQSC_SVRCONN_CHANNELS,
+    MQSC_SVRCONN_CHSTATUS,
+    MQSC_ACTIVE_CHSTATUS,
+]
+
+# runmqsc echoes every command it reads as "     1 : DISPLAY QMGR ALL"
+MQSC_ECHO_PATTERN = re.compile(r'\s*\d+\s*:\s')
+
+# Patterns for dspmq, dspmqver and MQSC output
+_RE_VERSION = re.compile(r'Version:\s+(\d+\.\d+\.\d+\.\d+)')
+_RE_QMNAME = re.compile(r'QMNAME\((.*?)\)\s+STATUS\((.*?)\)')
+_RE_PORT = re.compile(r'PORT\((\d+)\)')
+_RE_KV = re.compile(r'(\w+)\((.*?)\)')
+
+# Config files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_SIZE = 64 * 1024
+
+# Server entry of the configuration, defaults apply to keys the config leaves out
+Server = namedtuple('Server', [
+    'name', 'host', 'port', 'channel', 'queue_manager', 'user', 'password',
+    'ssl', 'cipher_spec', 'key_repository', 'no_auth'
+])
+Server.__new__.__defaults__ = ('Unknown', 'localhost', 1414, None, None, None, None,
+                               False, None, None, False)
+_SERVER_FIELDS = frozenset(Server._fields)
+
+# Command line options that override server configuration keys
+CLI_OVERRIDES = {
+    'host': 'host',
+    'port': 'port',
+    'channel': 'channel',
+    'qm': 'queue_manager',
+    'user': 'user',
+    'password': 'password',
+    'no_auth': 'no_auth',
+    'ssl': 'ssl',
+    'ssl_cipher': 'cipher_spec',
+    'key_repository': 'key_repository',
+}
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
@@ -52,51 +164,90 @@ def parse_arguments():
                        help="SSL cipher specification")
     parser.add_argument("--key-repository",
                        help="Path to SSL key repository")
+    parser.add_argument("-j", "--jobs", type=int, default=8,
+                       help="Number of servers tested in parallel (default: 8)")
     parser.add_argument("-v", "--verbose", action="store_true",
                        help="Show detailed output")
     return parser.parse_args()
 
-def print_header(text):
-    print(f"\n{Fore.CYAN}{'=' * 80}")
-    print(f"{Fore.CYAN}{text}")
-    print(f"{Fore.CYAN}{'=' * 80}{Style.RESET_ALL}")
+def cli_overrides(args):
+    """Return the server configuration keys set on the command line."""
+    if not args:
+        return {}
+    options = vars(args)
+    return {key: options[option] for option, key in CLI_OVERRIDES.items() if options.get(option)}
+
+def to_server(entry):
+    """Convert a mq_servers entry of the configuration to a Server."""
+    return Server(**{key: value for key, value in entry.items()
+                     if key in _SERVER_FIELDS and value is not None})
+
+def merge_server_config(server_config, args=None):
+    """Return server configuration with command line overrides applied."""
+    overrides = cli_overrides(args)
+    return server_config._replace(**overrides) if overrides else server_config
+
+def parse_kv_stream(text):
+    """Return all KEY(value) pairs of MQ command output in a single scan."""
+    return [(m.group(1), m.group(2)) for m in _RE_KV.finditer(text)]
+
+def group_kv_records(pairs, key):
+    """Split KEY(value) pairs into one dict per object, starting at each key."""
+    records = []
+    current = None
+    for k, v in pairs:
+        if k == key:
+            current = {k: v}
+            records.append(current)
+        elif current is not None:
+            current[k] = v
+    return records
+
+def print_header(text, out=print):
+    # One call per header, each line still starts in cyan
+    rule = f"{_CYAN}{'=' * 80}"
+    out(f"\n{rule}\n{_CYAN}{text}\n{rule}{_RESET_ALL}")
 
 def check_python_version():
     print_header("Checking Python Version")
-    version = sys.version.split()[0]
-    print(f"Python version: {version}")
-    if tuple(map(int, version.split('.'))) >= (3, 6):
-        print(f"{Fore.GREEN}✓ Python version is sufficient (>= 3.6)")
+    version = sys.version_info
+    print(f"Python version: {version.major}.{version.minor}.{version.micro}")
+    if version >= (3, 6):
+        print(f"{_GREEN}✓ Python version is sufficient (>= 3.6)")
     else:
-        print(f"{Fore.RED}✗ Python version is too low (required >= 3.6)")
+        print(f"{_RED}✗ Python version is too low (required >= 3.6)")
 
 def check_pymqi_installation():
     print_header("Checking pymqi Installation")
-    try:
-        import pymqi
-        print(f"{Fore.GREEN}✓ pymqi library is installed")
+    pymqi, error = lazy_import('pymqi')
+    if pymqi is not None:
+        print(f"{_GREEN}✓ pymqi library is installed")
         print(f"pymqi version: {pymqi.__version__}")
-    except ImportError as e:
-        print(f"{Fore.RED}✗ pymqi library is not installed: {e}")
-        print(f"{Fore.YELLOW}Tip: Install pymqi using: pip install pymqi")
+    else:
+        print(f"{_RED}✗ pymqi library is not installed: {error}")
+        print(f"{_YELLOW}Tip: Install pymqi using: pip install pymqi")
 
 def check_library_exists(path):
     """Check if MQ library exists in given path."""
-    lib_name = "mqic.dll" if platform.system() == "Windows" else "libmqm.so"
-    lib_path = os.path.join(path, lib_name)
+    lib_path = Path(path) / _LIB_NAME
     
-    if os.path.exists(lib_path):
-        print(f"{Fore.GREEN}✓ Found library: {lib_path}")
+    if lib_path.is_file():
+        print(f"{_GREEN}✓ Found library: {lib_path}")
         return True
     return False
 
+@functools.lru_cache(maxsize=1)
 def get_mq_installation_path():
     """Get IBM MQ installation path."""
     mq_paths = ["/opt/mqm", "/usr/local/mqm"]
-    for path in mq_paths:
-        if os.path.exists(path):
-            return path
-    return None
+    return next((path for path in mq_paths if Path(path).is_dir()), None)
+
+@functools.lru_cache(maxsize=1)
+def get_dspmqver_output(mq_path):
+    """Run dspmqver once and return its output (None if the command failed)."""
+    cmd = ['sudo', '-u', 'mqm', f'{mq_path}/bin/dspmqver']
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    return result.stdout if result.returncode == 0 else None
 
 def get_mq_version():
     """Get IBM MQ version using dspmqver command."""
@@ -105,20 +256,27 @@ def get_mq_version():
         return "Unknown"
     
     try:
-        cmd = f'sudo -u mqm {mq_path}/bin/dspmqver'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            version_match = re.search(r'Version:\s+(\d+\.\d+\.\d+\.\d+)', result.stdout)
+        version_info = get_dspmqver_output(mq_path)
+        if version_info:
+            version_match = _RE_VERSION.search(version_info)
             if version_match:
                 return version_match.group(1)
     except Exception as e:
-        print(f"{Fore.RED}Error getting MQ version: {e}")
+        print(f"{_RED}Error getting MQ version: {e}")
     return "Unknown"
 
+def create_probe_socket(timeout):
+    """Create a TCP socket tuned for a connect-only port probe."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _NO_LINGER)
+    if _TCP_USER_TIMEOUT is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, _TCP_USER_TIMEOUT, int(timeout * 1000))
+    return sock
+
 def check_port_status(host, port, timeout=5):
     """Check if port is open using socket connection."""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock = create_probe_socket(timeout)
         sock.settimeout(timeout)
         result = sock.connect_ex((host, port))
         sock.close()
@@ -126,91 +284,176 @@ def check_port_status(host, port, timeout=5):
     except:
         return False
 
+def run_mqsc_batch(qmgr_name, mq_path, commands):
+    """Run all MQSC commands in one runmqsc session and return output per command."""
+    # stderr goes to a file, so it cannot fill a pipe while stdout is read
+    with tempfile.TemporaryFile('w+') as stderr:
+        proc = subprocess.Popen(
+            ['sudo', '-u', 'mqm', f'{mq_path}/bin/runmqsc', qmgr_name],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr, text=True
+        )
+        proc.stdin.write("\n".join(commands) + "\n")
+        proc.stdin.close()
+        
+        # Read output as it arrives; each section starts at the echo of its command,
+        # lines before the first echo are the banner and any startup error
+        wanted = set(commands)
+        sections = {}
+        banner = []
+        current = banner
+        for line in proc.stdout:
+            match = MQSC_ECHO_PATTERN.match(line)
+            if match:
+                command = line[match.end():].strip()
+                current = sections[command] = [] if command in wanted else None
+            elif current is not None:
+                current.append(line)
+        proc.stdout.close()
+        proc.wait()
+        stderr.seek(0)
+        error = stderr.read().strip()
+    
+    # A command without its echo never ran, e.g. the Queue Manager is not running
+    missing = [command for command in commands if command not in sections]
+    if missing:
+        reason = error or next((line.strip() for line in reversed(banner) if line.strip()), '')
+        raise RuntimeError(f"runmqsc ended before running {', '.join(missing)} "
+                           f"(exit code {proc.returncode}){': ' + reason if reason else ''}")
+    return {command: "".join(lines) for command, lines in sections.items()}
+
+def probe_ports(hostports, timeout=5):
+    """Check several ports at once using non-blocking connects and one selector."""
+    results = {hostport: False for hostport in hostports}
+    in_progress = (errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, 'WSAEWOULDBLOCK', None))
+    sel = selectors.DefaultSelector()
+    try:
+        for hostport in results:
+            sock = create_probe_socket(timeout)
+            sock.setblocking(False)
+            try:
+                result = sock.connect_ex(hostport)
+            except OSError:
+                sock.close()
+                continue
+            if result in in_progress:
+                sel.register(sock, selectors.EVENT_WRITE, hostport)
+            else:
+                results[hostport] = result == 0
+                sock.close()
+        
+        # Wait for all pending connects with a single deadline
+        deadline = time.monotonic() + timeout
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                sock = key.fileobj
+                results[key.data] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                sel.unregister(sock)
+                sock.close()
+    finally:
+        for key in list(sel.get_map().values()):
+            key.fileobj.close()
+        sel.close()
+    return results
+
 def get_qmgr_list():
     """Get list of Queue Managers using dspmq command."""
     mq_path = get_mq_installation_path()
     if not mq_path:
-        print(f"{Fore.RED}Error: MQ installation path not found")
+        print(f"{_RED}Error: MQ installation path not found")
         return []
     
     try:
-        cmd = f'sudo -u mqm {mq_path}/bin/dspmq'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        cmd = ['sudo', '-u', 'mqm', f'{mq_path}/bin/dspmq']
+        result = subprocess.run(cmd, capture_output=True, text=True)
         if result.returncode == 0:
-            qmgrs = []
+            found = []
             for line in result.stdout.splitlines():
-                match = re.search(r'QMNAME\((.*?)\)\s+STATUS\((.*?)\)', line)
+                match = _RE_QMNAME.search(line)
                 if match:
-                    qmgr_name = match.group(1)
-                    qmgr_status = match.group(2)
-                    
-                    # Get port for this Queue Manager
-                    port = get_qmgr_port(qmgr_name, mq_path)
-                    
-                    # Get permissions
-                    perms = check_qmgr_permissions(qmgr_name, mq_path)
-                    
-                    qmgrs.append({
-                        'name': qmgr_name,
-                        'status': qmgr_status,
-                        'port': port,
-                        'permissions': perms
-                    })
+                    found.append((match.group(1), match.group(2)))
+            if not found:
+                return []
+            
+            # Query all Queue Managers concurrently, map() keeps dspmq order
+            with ThreadPoolExecutor(max_workers=min(32, len(found))) as executor:
+                qmgrs = list(executor.map(
+                    lambda qm: get_qmgr_info(qm[0], qm[1], mq_path), found
+                ))
+            
+            # Probe all listener ports together
+            ports = probe_ports([('localhost', qmgr['port']) for qmgr in qmgrs if qmgr['port']],
+                                timeout=LOCAL_PROBE_TIMEOUT)
+            for qmgr in qmgrs:
+                qmgr['port_open'] = ports.get(('localhost', qmgr['port']), False)
             return qmgrs
     except FileNotFoundError:
-        print(f"{Fore.RED}Error: dspmq command not found")
+        print(f"{_RED}Error: dspmq command not found")
     except Exception as e:
-        print(f"{Fore.RED}Error getting Queue Manager list: {e}")
+        print(f"{_RED}Error getting Queue Manager list: {e}")
     return []
 
-def get_qmgr_port(qmgr_name, mq_path):
-    """Get Queue Manager listener port using runmqsc command."""
+def get_qmgr_info(qmgr_name, qmgr_status, mq_path):
+    """Collect port, permissions and MQSC output for one Queue Manager."""
+    # Run all MQSC queries for this Queue Manager at once
     try:
-        # Get port from LSSTATUS
-        cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY LSSTATUS(*) PORT\\" | {mq_path}/bin/runmqsc {qmgr_name}"'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            # Look for line with PORT(number)
-            port_match = re.search(r'PORT\((\d+)\)', result.stdout)
-            if port_match:
-                return int(port_match.group(1))
-            
-            # If port not found in LSSTATUS, try DISPLAY QMGR
-            cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY QMGR PORT\\" | {mq_path}/bin/runmqsc {qmgr_name}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                port_match = re.search(r'PORT\((\d+)\)', result.stdout)
-                if port_match:
-                    return int(port_match.group(1))
+        mqsc = run_mqsc_batch(qmgr_name, mq_path, QMGR_MQSC_COMMANDS)
     except Exception as e:
-        print(f"{Fore.RED}Error getting port for {qmgr_name}: {e}")
+        print(f"{_RED}Error running runmqsc for {qmgr_name}: {e}")
+        mqsc = {}
+    
+    # Get port for this Queue Manager
+    port = get_qmgr_port(qmgr_name, mqsc)
+    
+    # Get permissions
+    perms = check_qmgr_permissions(qmgr_name, mqsc)
+    
+    return {
+        'name': qmgr_name,
+        'status': qmgr_status,
+        'port': port,
+        'permissions': perms,
+        'mqsc': mqsc
+    }
+
+def get_qmgr_port(qmgr_name, mqsc):
+    """Get Queue Manager listener port from runmqsc output."""
+    try:
+        # Look for line with PORT(number) in LSSTATUS
+        port_match = _RE_PORT.search(mqsc.get(MQSC_LSSTATUS_PORT, ''))
+        if port_match:
+            return int(port_match.group(1))
+        
+        # If port not found in LSSTATUS, try DISPLAY QMGR
+        port_match = _RE_PORT.search(mqsc.get(MQSC_QMGR_PORT, ''))
+        if port_match:
+            return int(port_match.group(1))
+    except Exception as e:
+        print(f"{_RED}Error getting port for {qmgr_name}: {e}")
     return None
 
-def check_qmgr_permissions(qmgr_name, mq_path):
-    """Check permissions for Queue Manager."""
+def check_qmgr_permissions(qmgr_name, mqsc):
+    """Check permissions for Queue Manager from runmqsc output."""
     try:
         # Check CHLAUTH
-        cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY QMGR CHLAUTH\\" | {mq_path}/bin/runmqsc {qmgr_name}"'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        chlauth = mqsc.get(MQSC_QMGR_CHLAUTH, '')
         permissions = {
-            'chlauth': 'ENABLED' in result.stdout,
-            'can_connect': result.returncode == 0
+            'chlauth': 'ENABLED' in chlauth,
+            'can_connect': 'AMQ8408I' in chlauth
         }
         
         # Check access to system queue
-        cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY Q(SYSTEM.DEFAULT.LOCAL.QUEUE)\\" | {mq_path}/bin/runmqsc {qmgr_name}"'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        permissions['can_browse'] = result.returncode == 0
+        permissions['can_browse'] = 'AMQ8409I' in mqsc.get(MQSC_SYSTEM_QUEUE, '')
         
         # Add additional Queue Manager information
-        cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY QMGR ALL\\" | {mq_path}/bin/runmqsc {qmgr_name}"'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            permissions['details'] = result.stdout
+        if 'AMQ8408I' in mqsc.get(MQSC_QMGR_ALL, ''):
+            permissions['details'] = mqsc[MQSC_QMGR_ALL]
         
         return permissions
     except Exception as e:
-        print(f"{Fore.RED}Error checking permissions for {qmgr_name}: {e}")
+        print(f"{_RED}Error checking permissions for {qmgr_name}: {e}")
         return None
 
 def check_mq_client_libraries():
@@ -227,41 +470,61 @@ def check_mq_client_libraries():
     
     # List of key MQ libraries
     mq_libraries = [
-        ("libmqic" if platform.system() != "Windows" else "mqic"),
-        ("libmqm" if platform.system() != "Windows" else "mqm")
+        ("libmqic" if not _IS_WINDOWS else "mqic"),
+        ("libmqm" if not _IS_WINDOWS else "mqm")
     ]
     
+    lib_extensions = [".so", ".dll", ".sl", ".a", ""]
+    lib_names = [f"{lib}{ext}" for lib in mq_libraries for ext in lib_extensions]
+    targets = set(lib_names)
+    
     found_libraries = False
     
     for path in mq_paths:
-        if not path or not os.path.exists(path):
+        if not path:
+            continue
+        
+        # Read each directory once instead of probing every candidate name
+        try:
+            with os.scandir(path) as entries:
+                hits = {
+                    entry.name.lower() if _IS_WINDOWS else entry.name
+                    for entry in entries
+                }
+        except OSError:
             continue
+        hits &= targets
         
         print(f"\nChecking path: {path}")
-        for lib in mq_libraries:
-            lib_extensions = [".so", ".dll", ".sl", ".a", ""]
-            for ext in lib_extensions:
-                lib_path = os.path.join(path, f"{lib}{ext}")
-                if os.path.exists(lib_path):
-                    print(f"{Fore.GREEN}✓ Found library: {lib_path}")
-                    found_libraries = True
+        for lib_name in lib_names:
+            if lib_name in hits:
+                print(f"{_GREEN}✓ Found library: {os.path.join(path, lib_name)}")
+                found_libraries = True
     
     if not found_libraries:
-        print(f"{Fore.RED}✗ No MQ libraries were found")
-        print(f"{Fore.YELLOW}Tip: Install IBM MQ client libraries from:")
-        print(f"{Fore.YELLOW}https://www.ibm.com/support/pages/downloading-ibm-mq-9x-clients")
+        print(f"{_RED}✗ No MQ libraries were found")
+        print(f"{_YELLOW}Tip: Install IBM MQ client libraries from:")
+        print(f"{_YELLOW}https://www.ibm.com/support/pages/downloading-ibm-mq-9x-clients")
 
 def check_mq_installations():
     print_header("Checking IBM MQ Installations")
     installations = []
     
     mq_path = get_mq_installation_path()
+    dspmq_proc = None
     if mq_path:
+        is_full = (Path(mq_path) / "bin" / "strmqm").is_file()
+        if is_full:
+            # Start the installation listing now so it runs alongside dspmqver
+            try:
+                cmd = ['sudo', '-u', 'mqm', f'{mq_path}/bin/dspmq', '-o', 'installation']
+                dspmq_proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                              stderr=subprocess.PIPE, text=True)
+            except Exception:
+                dspmq_proc = None
         try:
-            cmd = f'sudo -u mqm {mq_path}/bin/dspmqver'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                version_info = result.stdout
+            version_info = get_dspmqver_output(mq_path)
+            if version_info:
                 # Parse version from output
                 for line in version_info.splitlines():
                     if "Version:" in line:
@@ -269,119 +532,189 @@ def check_mq_installations():
                         installations.append({
                             "version": version,
                             "path": mq_path,
-                            "type": "Full" if os.path.exists(os.path.join(mq_path, "bin", "strmqm")) else "Client"
+                            "type": "Full" if is_full else "Client"
                         })
                         break
         except Exception as e:
-            print(f"{Fore.YELLOW}⚠ Error checking MQ version at {mq_path}: {e}")
+            print(f"{_YELLOW}⚠ Error checking MQ version at {mq_path}: {e}")
 
     if installations:
-        print(f"{Fore.GREEN}Found {len(installations)} IBM MQ installation(s):\n")
+        print(f"{_GREEN}Found {len(installations)} IBM MQ installation(s):\n")
         for inst in installations:
-            print(f"{Fore.CYAN}╔══ Installation Details {'═' * 45}")
-            print(f"{Fore.CYAN}║")
-            print(f"{Fore.CYAN}║ {Fore.RESET}Version: {inst['version']}")
-            print(f"{Fore.CYAN}║ {Fore.RESET}Path: {inst['path']}")
-            print(f"{Fore.CYAN}║ {Fore.RESET}Type: {inst['type']}")
+            print(f"{_CYAN}╔══ Installation Details {'═' * 45}")
+            print(f"{_CYAN}║")
+            print(f"{_CYAN}║ {_RESET}Version: {inst['version']}")
+            print(f"{_CYAN}║ {_RESET}Path: {inst['path']}")
+            print(f"{_CYAN}║ {_RESET}Type: {inst['type']}")
             
             # Display additional installation information
-            if inst['type'] == "Full":
+            if inst['type'] == "Full" and dspmq_proc:
                 try:
-                    cmd = f'sudo -u mqm {mq_path}/bin/dspmq -o installation'
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                    if result.returncode == 0:
-                        print(f"{Fore.CYAN}║")
-                        print(f"{Fore.CYAN}║ {Fore.RESET}Queue Managers in this Installation:")
-                        print(f"{Fore.CYAN}║ {Fore.RESET}{'─' * 58}")
+                    stdout, _ = dspmq_proc.communicate()
+                    if dspmq_proc.returncode == 0:
+                        print(f"{_CYAN}║")
+                        print(f"{_CYAN}║ {_RESET}Queue Managers in this Installation:")
+                        print(f"{_CYAN}║ {_RESET}{'─' * 58}")
                         
-                        # Split and format each line
-                        for line in result.stdout.splitlines():
-                            if line.strip():
-                                # Split line into parts
-                                parts = re.findall(r'(\w+)\((.*?)\)', line)
-                                if parts:
-                                    print(f"{Fore.CYAN}║ {Fore.RESET}", end="")
-                                    for key, value in parts:
-                                        if key == "QMNAME":
-                                            print(f"{Fore.GREEN}{value:20}", end="")
-                                        elif key == "INSTNAME":
-                                            print(f"{Fore.YELLOW}{value:15}", end="")
-                                        elif key == "INSTPATH":
-                                            print(f"{value:20}", end="")
-                                        elif key == "INSTVER":
-                                            print(f"{Fore.CYAN}{value}", end="")
-                                    print()
+                        # One row per Queue Manager
+                        rows = []
+                        for record in group_kv_records(parse_kv_stream(stdout), "QMNAME"):
+                            row = [f"{_CYAN}║ {_RESET}", f"{_GREEN}{record['QMNAME']:20}"]
+                            if "INSTNAME" in record:
+                                row.append(f"{_YELLOW}{record['INSTNAME']:15}")
+                            if "INSTPATH" in record:
+                                row.append(f"{record['INSTPATH']:20}")
+                            if "INSTVER" in record:
+                                row.append(f"{_CYAN}{record['INSTVER']}")
+                            rows.append("".join(row) + _RESET_ALL + "\n")
+                        sys.stdout.write("".join(rows))
                 except Exception:
                     pass
-            print(f"{Fore.CYAN}╚{'═' * 60}")
+            print(f"{_CYAN}╚{'═' * 60}")
             print()
     else:
-        print(f"{Fore.YELLOW}No IBM MQ installations found in standard locations")
-        print(f"{Fore.YELLOW}Note: This might be normal if using standalone client libraries")
+        print(f"{_YELLOW}No IBM MQ installations found in standard locations")
+        print(f"{_YELLOW}Note: This might be normal if using standalone client libraries")
+
+    # Reap the installation listing if it was not needed
+    if dspmq_proc and dspmq_proc.returncode is None:
+        dspmq_proc.communicate()
+
+def resolve_hosts(hosts):
+    """Resolve host names concurrently to their addresses, hosts that fail to resolve are left out."""
+    def resolve(host):
+        try:
+            # Keep every address in resolver order, the probe tries them like create_connection does
+            infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+            return list(dict.fromkeys(info[4][0] for info in infos))
+        except Exception:
+            # The server test connects by name and reports the error itself
+            return None
+    
+    hosts = list(hosts)
+    if not hosts:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(32, len(hosts))) as executor:
+        resolved = executor.map(resolve, hosts)
+        return {host: addresses for host, addresses in zip(hosts, resolved) if addresses}
+
+def connect_first_address(host, port, addresses=None, timeout=5):
+    """Open TCP connection to the first resolved address that accepts it, by host name if none are given."""
+    if not addresses:
+        return socket.create_connection((host, port), timeout=timeout)
+    error = None
+    for address in addresses:
+        try:
+            return socket.create_connection((address, port), timeout=timeout)
+        except socket.error as e:
+            error = e
+    raise error
 
-def check_network_connectivity(host, port):
-    print_header(f"Basic Network Tests for {host}:{port}")
+def check_network_connectivity(host, port, out=print, addresses=None):
+    print_header(f"Basic Network Tests for {host}:{port}", out)
     
     # TCP Port Test (like telnet)
-    print(f"{Fore.CYAN}1. Basic TCP Port Test{Style.RESET_ALL}")
+    out(f"{_CYAN}1. Basic TCP Port Test{_RESET_ALL}")
+    rtt = None
     try:
-        sock = socket.create_connection((host, port), timeout=5)
+        start = time.monotonic()
+        sock = connect_first_address(host, port, addresses)
+        rtt = time.monotonic() - start
         sock.close()
-        print(f"{Fore.GREEN}✓ TCP port {port} is open and accepting connections")
+        out(f"{_GREEN}✓ TCP port {port} is open and accepting connections (connect time: {rtt * 1000:.1f} ms)")
         port_available = True
     except socket.error as e:
-        print(f"{Fore.RED}✗ Cannot connect to TCP port {port}: {e}")
+        out(f"{_RED}✗ Cannot connect to TCP port {port}: {e}")
         port_available = False
         
         # If connection failed, try netstat
-        print(f"\n{Fore.YELLOW}Checking local ports with netstat...{Style.RESET_ALL}")
+        out(f"\n{_YELLOW}Checking local ports with netstat...{_RESET_ALL}")
         try:
-            if platform.system() == "Windows":
-                cmd = f"netstat -an | findstr :{port}"
+            if _IS_WINDOWS:
+                cmd = ['netstat', '-an']
             else:
-                cmd = f"netstat -tuln | grep :{port}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.stdout:
-                print(f"{Fore.GREEN}Found port {port} in netstat output:")
-                print(result.stdout)
+                cmd = ['netstat', '-tuln']
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Match the port as a whole address suffix, so 1414 does not match 14141
+            suffix = f":{port}"
+            matches = [line for line in result.stdout.splitlines()
+                       if any(field.endswith(suffix) for field in line.split())]
+            if matches:
+                out(f"{_GREEN}Found port {port} in netstat output:")
+                out("\n".join(matches))
             else:
-                print(f"{Fore.YELLOW}Port {port} not found in netstat output")
+                out(f"{_YELLOW}Port {port} not found in netstat output")
         except Exception as e:
-            print(f"{Fore.RED}Error running netstat: {e}")
+            out(f"{_RED}Error running netstat: {e}")
     
-    return port_available
+    return port_available, rtt
+
+@functools.lru_cache(maxsize=None)
+def to_mq_bytes(value):
+    """Encode a configuration string for pymqi, shared across servers."""
+    return value.encode('utf-8')
 
-def test_mq_connection(server_config, args=None):
-    print(f"\n{Fore.CYAN}2. IBM MQ Connection Test{Style.RESET_ALL}")
+@functools.lru_cache(maxsize=None)
+def to_conn_name(host, port):
+    """Build the host(port) connection name bytes for pymqi."""
+    return f"{host}({port})".encode('utf-8')
+
+def connect_queue_manager(queue_manager_b, cd, sco=None):
+    """Connect to Queue Manager using prepared CD and optional SCO."""
+    pymqi, _ = lazy_import('pymqi')
+    qmgr = pymqi.QueueManager(None)
+    if sco:
+        qmgr.connect_with_options(queue_manager_b, cd, sco)
+    else:
+        qmgr.connect_with_options(queue_manager_b, cd)
+    return qmgr
+
+def disconnect_queue_manager(qmgr, out=print):
+    """Disconnect from Queue Manager, a failure is reported but not raised."""
+    pymqi, _ = lazy_import('pymqi')
     try:
-        import pymqi
-        
-        # Use command line arguments if available
-        host = args.host if args and args.host else server_config['host']
-        port = args.port if args and args.port else server_config['port']
-        channel = args.channel if args and args.channel else server_config['channel']
-        queue_manager = args.qm if args and args.qm else server_config['queue_manager']
-        user = args.user if args and args.user else server_config.get('user')
-        password = args.password if args and args.password else server_config.get('password')
+        qmgr.disconnect()
+        out(f"{_GREEN}✓ Successfully disconnected from Queue Manager")
+    except pymqi.MQMIError as e:
+        out(f"{_YELLOW}⚠ Error disconnecting from Queue Manager: {e}")
+
+def test_mq_connection(server_config, args=None, out=print):
+    out(f"\n{_CYAN}2. IBM MQ Connection Test{_RESET_ALL}")
+    pymqi, error = lazy_import('pymqi')
+    if pymqi is None:
+        out(f"{_RED}✗ Error during MQ connection test: {error}")
+        return False
+    try:
+        # Apply command line arguments over the server configuration once
+        cfg = merge_server_config(server_config, args)
+        host = cfg.host
+        port = cfg.port
+        channel = cfg.channel
+        queue_manager = cfg.queue_manager
+        user = cfg.user
+        password = cfg.password
+        no_auth = cfg.no_auth
         
         # SSL configuration
-        use_ssl = args.ssl if args and args.ssl else server_config.get('ssl', False)
-        ssl_cipher = args.ssl_cipher if args and args.ssl_cipher else server_config.get('cipher_spec')
-        key_repo = args.key_repository if args and args.key_repository else server_config.get('key_repository')
+        use_ssl = cfg.ssl
+        ssl_cipher = cfg.cipher_spec
+        key_repo = cfg.key_repository
+        
+        if not channel or not queue_manager:
+            out(f"{_RED}✗ Channel and Queue Manager must be set for the MQ connection test")
+            return False
 
         # Convert values to bytes for pymqi
-        host_b = host.encode('utf-8')
-        port_b = str(port).encode('utf-8')
-        channel_b = channel.encode('utf-8')
-        queue_manager_b = queue_manager.encode('utf-8')
-        conn_info = host_b + b'(' + port_b + b')'
+        channel_b = to_mq_bytes(channel)
+        queue_manager_b = to_mq_bytes(queue_manager)
+        conn_info = to_conn_name(host, port)
         
-        print(f"Attempting to connect to Queue Manager {queue_manager}")
-        print(f"Channel: {channel}")
-        print(f"Connection info: {host}({port})")
+        out(f"Attempting to connect to Queue Manager {queue_manager}")
+        out(f"Channel: {channel}")
+        out(f"Connection info: {host}({port})")
         
         try:
-            # Create CD object
+            # Create CD object, reused if the connection is retried below
             cd = pymqi.CD()
             cd.ChannelName = channel_b
             cd.ConnectionName = conn_info
@@ -390,96 +723,93 @@ def test_mq_connection(server_config, args=None):
 
             # SSL configuration
             if use_ssl:
-                print(f"{Fore.CYAN}Using SSL/TLS connection")
-                cd.SSLCipherSpec = ssl_cipher.encode('utf-8') if ssl_cipher else None
+                out(f"{_CYAN}Using SSL/TLS connection")
+                cd.SSLCipherSpec = to_mq_bytes(ssl_cipher) if ssl_cipher else None
                 if key_repo:
-                    cd.SSLKeyRepository = key_repo.encode('utf-8')
+                    cd.SSLKeyRepository = to_mq_bytes(key_repo)
 
             # Connect to Queue Manager
-            if not args.no_auth and user and password:
-                print(f"Connecting with authentication (user: {user})")
+            if not no_auth and user and password:
+                out(f"Connecting with authentication (user: {user})")
                 sco = pymqi.SCO()
-                sco.UserIdentifier = user.encode('utf-8')
+                sco.UserIdentifier = to_mq_bytes(user)
                 sco.Password = password.encode('utf-8')
-                qmgr = pymqi.QueueManager(None)
-                qmgr.connect_with_options(queue_manager_b, cd, sco)
+                qmgr = connect_queue_manager(queue_manager_b, cd, sco)
             else:
-                print("Connecting without authentication")
-                qmgr = pymqi.QueueManager(None)
-                qmgr.connect_with_options(queue_manager_b, cd)
+                out("Connecting without authentication")
+                qmgr = connect_queue_manager(queue_manager_b, cd)
 
-            print(f"{Fore.GREEN}✓ Successfully connected to Queue Manager {queue_manager}")
-            
-            # Try to get Queue Manager attributes
-            attrs = qmgr.inquire(pymqi.CMQC.MQCA_Q_MGR_NAME)
-            print(f"{Fore.GREEN}✓ Queue Manager name confirmed: {attrs.strip()}")
+            out(f"{_GREEN}✓ Successfully connected to Queue Manager {queue_manager}")
             
-            # Test access to system queue
             try:
-                system_queue = pymqi.Queue(qmgr, 'SYSTEM.DEFAULT.LOCAL.QUEUE', pymqi.CMQC.MQOO_INQUIRE)
-                print(f"{Fore.GREEN}✓ Access to system queue OK")
-                system_queue.close()
-            except pymqi.MQMIError as e:
-                print(f"{Fore.YELLOW}⚠ Cannot access system queue: {e}")
-            
-            qmgr.disconnect()
-            print(f"{Fore.GREEN}✓ Successfully disconnected from Queue Manager")
+                # Try to get Queue Manager attributes
+                attrs = qmgr.inquire(pymqi.CMQC.MQCA_Q_MGR_NAME)
+                out(f"{_GREEN}✓ Queue Manager name confirmed: {attrs.strip()}")
+                
+                # Test access to system queue
+                try:
+                    system_queue = pymqi.Queue(qmgr, 'SYSTEM.DEFAULT.LOCAL.QUEUE', pymqi.CMQC.MQOO_INQUIRE)
+                    out(f"{_GREEN}✓ Access to system queue OK")
+                    system_queue.close()
+                except pymqi.MQMIError as e:
+                    out(f"{_YELLOW}⚠ Cannot access system queue: {e}")
+            finally:
+                disconnect_queue_manager(qmgr, out)
             return True
             
         except pymqi.MQMIError as e:
-            print(f"{Fore.RED}✗ MQ Error: {e}")
-            print(f"{Fore.YELLOW}Error details:")
-            print(f"  Completion Code: {e.comp}")
-            print(f"  Reason Code: {e.reason}")
+            out(f"{_RED}✗ MQ Error: {e}")
+            out(f"{_YELLOW}Error details:")
+            out(f"  Completion Code: {e.comp}")
+            out(f"  Reason Code: {e.reason}")
             
             # If authentication fails, try without it
-            if e.reason == pymqi.CMQC.MQRC_NOT_AUTHORIZED and user and not args.no_auth:
-                print(f"{Fore.YELLOW}Authentication failed, trying without credentials...")
+            if e.reason == pymqi.CMQC.MQRC_NOT_AUTHORIZED and user and not no_auth:
+                out(f"{_YELLOW}Authentication failed, trying without credentials...")
                 try:
-                    qmgr = pymqi.QueueManager(None)
-                    qmgr.connect_with_options(queue_manager_b, cd)
-                    print(f"{Fore.GREEN}✓ Successfully connected without authentication")
-                    
-                    attrs = qmgr.inquire(pymqi.CMQC.MQCA_Q_MGR_NAME)
-                    print(f"{Fore.GREEN}✓ Queue Manager name confirmed: {attrs.strip()}")
+                    qmgr = connect_queue_manager(queue_manager_b, cd)
+                    out(f"{_GREEN}✓ Successfully connected without authentication")
                     
-                    qmgr.disconnect()
-                    print(f"{Fore.GREEN}✓ Successfully disconnected from Queue Manager")
+                    try:
+                        attrs = qmgr.inquire(pymqi.CMQC.MQCA_Q_MGR_NAME)
+                        out(f"{_GREEN}✓ Queue Manager name confirmed: {attrs.strip()}")
+                    finally:
+                        disconnect_queue_manager(qmgr, out)
                     return True
                 except pymqi.MQMIError as e2:
-                    print(f"{Fore.RED}✗ Connection without authentication also failed:")
-                    print(f"{Fore.RED}  Completion Code: {e2.comp}, Reason: {e2.reason}")
+                    out(f"{_RED}✗ Connection without authentication also failed:")
+                    out(f"{_RED}  Completion Code: {e2.comp}, Reason: {e2.reason}")
             return False
             
     except Exception as e:
-        print(f"{Fore.RED}✗ Error during MQ connection test: {e}")
+        out(f"{_RED}✗ Error during MQ connection test: {e}")
         return False
 
-def check_mq_server_info(host, port, channel, queue_manager, args=None):
-    print_header("MQ Server Configuration Details")
-    print(f"Queue Manager: {queue_manager}")
-    print(f"Channel: {channel}")
-    print(f"Host: {host}")
-    print(f"Port: {port}")
+def check_mq_server_info(host, port, channel, queue_manager, args=None, out=print):
+    print_header("MQ Server Configuration Details", out)
+    out(f"Queue Manager: {queue_manager}")
+    out(f"Channel: {channel}")
+    out(f"Host: {host}")
+    out(f"Port: {port}")
     
     if args and args.verbose:
-        print("\nAdditional Information:")
-        print(f"SSL/TLS: {'Yes' if args.ssl else 'No'}")
+        out("\nAdditional Information:")
+        out(f"SSL/TLS: {'Yes' if args.ssl else 'No'}")
         if args.ssl:
-            print(f"SSL Cipher: {args.ssl_cipher if args.ssl_cipher else 'Default'}")
-            print(f"Key Repository: {args.key_repository if args.key_repository else 'Not set'}")
+            out(f"SSL Cipher: {args.ssl_cipher if args.ssl_cipher else 'Default'}")
+            out(f"Key Repository: {args.key_repository if args.key_repository else 'Not set'}")
     
     # Attempt to run MQSC command for testing
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         try:
-            cmd = f"echo 'DISPLAY QMGR' | runmqsc {queue_manager}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            cmd = ['runmqsc', queue_manager]
+            result = subprocess.run(cmd, input="DISPLAY QMGR\n", capture_output=True, text=True)
             if result.returncode == 0:
-                print(f"{Fore.GREEN}✓ Queue Manager is available locally")
+                out(f"{_GREEN}✓ Queue Manager is available locally")
             else:
-                print(f"{Fore.YELLOW}⚠ Queue Manager is not available locally (may not be an issue for remote connections)")
+                out(f"{_YELLOW}⚠ Queue Manager is not available locally (may not be an issue for remote connections)")
         except Exception as e:
-            print(f"{Fore.YELLOW}⚠ Cannot test local Queue Manager availability: {e}")
+            out(f"{_YELLOW}⚠ Cannot test local Queue Manager availability: {e}")
 
 def display_qmgr_details():
     """Display detailed information about Queue Managers."""
@@ -487,209 +817,298 @@ def display_qmgr_details():
     
     mq_path = get_mq_installation_path()
     if not mq_path:
-        print(f"{Fore.RED}Error: MQ installation path not found")
+        print(f"{_RED}Error: MQ installation path not found")
         return
         
     qmgrs = get_qmgr_list()
     
     if not qmgrs:
-        print(f"{Fore.YELLOW}⚠ No Queue Managers found or unable to retrieve Queue Manager list")
+        print(f"{_YELLOW}⚠ No Queue Managers found or unable to retrieve Queue Manager list")
         return
     
     print(f"Found {len(qmgrs)} Queue Manager(s):\n")
     
     for qmgr in qmgrs:
-        print(f"{Fore.CYAN}╔══ Queue Manager: {qmgr['name']} {'═' * 40}")
-        print(f"{Fore.CYAN}║")
-        print(f"{Fore.CYAN}║ {Fore.RESET}Status: {Fore.GREEN if qmgr['status'] == 'RUNNING' else Fore.RED}{qmgr['status']}")
+        # Collect the whole block and write it at once
+        buf = []
+        out = buf.append
+        
+        out(f"{_CYAN}╔══ Queue Manager: {qmgr['name']} {'═' * 40}")
+        out(f"{_CYAN}║")
+        out(f"{_CYAN}║ {_RESET}Status: {_GREEN if qmgr['status'] == 'RUNNING' else _RED}{qmgr['status']}")
+        
+        mqsc = qmgr['mqsc']
         
         # Display detailed information about Queue Manager
         try:
-            cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY QMGR ALL\\" | {mq_path}/bin/runmqsc {qmgr["name"]}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0 and 'AMQ8408I' in result.stdout:
-                print(f"{Fore.CYAN}║")
-                print(f"{Fore.CYAN}║ {Fore.RESET}Queue Manager Configuration:")
-                for line in result.stdout.splitlines():
+            output = mqsc.get(MQSC_QMGR_ALL, '')
+            if 'AMQ8408I' in output:
+                out(f"{_CYAN}║")
+                out(f"{_CYAN}║ {_RESET}Queue Manager Configuration:")
+                for line in output.splitlines():
                     if any(key in line for key in ['PORT', 'DESCR', 'DEADQ', 'DEFXMITQ']):
-                        print(f"{Fore.CYAN}║   {Fore.RESET}{line.strip()}")
+                        out(f"{_CYAN}║   {_RESET}{line.strip()}")
         except Exception:
             pass
 
         # Display listener information
         try:
             # First get listener configuration
-            cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY LISTENER(*)\\" | {mq_path}/bin/runmqsc {qmgr["name"]}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            listener_config = {}
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    if 'LISTENER(' in line:
-                        matches = re.findall(r'(\w+)\((.*?)\)', line)
-                        for key, value in matches:
-                            listener_config[key] = value
+            listener_config = {
+                record['LISTENER']: record
+                for record in group_kv_records(parse_kv_stream(mqsc.get(MQSC_LISTENER, '')), 'LISTENER')
+            }
 
             # Then get listener status
-            cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY LSSTATUS(*)\\" | {mq_path}/bin/runmqsc {qmgr["name"]}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0 and ('AMQ8631I' in result.stdout or 'AMQ8630I' in result.stdout):
-                print(f"{Fore.CYAN}║")
-                print(f"{Fore.CYAN}║ {Fore.RESET}Listener Status:")
-                for line in result.stdout.splitlines():
-                    if 'LISTENER(' in line:
-                        matches = re.findall(r'(\w+)\((.*?)\)', line)
-                        listener_info = {}
-                        for key, value in matches:
-                            listener_info[key] = value
-                        
-                        # Display detailed information about listener
-                        print(f"{Fore.CYAN}║   {Fore.RESET}Listener name: {Fore.GREEN}{listener_info.get('LISTENER', 'N/A')}")
-                        print(f"{Fore.CYAN}║   {Fore.RESET}Status: {Fore.GREEN if listener_info.get('STATUS') == 'RUNNING' else Fore.RED}{listener_info.get('STATUS', 'N/A')}")
-                        if 'PORT' in listener_config:
-                            print(f"{Fore.CYAN}║   {Fore.RESET}Port: {listener_config.get('PORT', 'N/A')}")
-                        if 'TRPTYPE' in listener_config:
-                            print(f"{Fore.CYAN}║   {Fore.RESET}Transport type: {listener_config.get('TRPTYPE', 'N/A')}")
-                        if 'CONTROL' in listener_config:
-                            print(f"{Fore.CYAN}║   {Fore.RESET}Control: {listener_config.get('CONTROL', 'N/A')}")
+            output = mqsc.get(MQSC_LSSTATUS, '')
+            if 'AMQ8631I' in output or 'AMQ8630I' in output:
+                out(f"{_CYAN}║")
+                out(f"{_CYAN}║ {_RESET}Listener Status:")
+                for listener_info in group_kv_records(parse_kv_stream(output), 'LISTENER'):
+                    config = listener_config.get(listener_info['LISTENER'], {})
+                    
+                    # Display detailed information about listener
+                    out(f"{_CYAN}║   {_RESET}Listener name: {_GREEN}{listener_info['LISTENER']}")
+                    out(f"{_CYAN}║   {_RESET}Status: {_GREEN if listener_info.get('STATUS') == 'RUNNING' else _RED}{listener_info.get('STATUS', 'N/A')}")
+                    if 'PORT' in config:
+                        out(f"{_CYAN}║   {_RESET}Port: {config['PORT']}")
+                    if 'TRPTYPE' in config:
+                        out(f"{_CYAN}║   {_RESET}Transport type: {config['TRPTYPE']}")
+                    if 'CONTROL' in config:
+                        out(f"{_CYAN}║   {_RESET}Control: {config['CONTROL']}")
         except Exception as e:
-            print(f"{Fore.CYAN}║   {Fore.YELLOW}⚠ Unable to get listener information: {e}")
+            out(f"{_CYAN}║   {_YELLOW}⚠ Unable to get listener information: {e}")
 
         # Display information about SVRCONN channels
         try:
-            cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY CHANNEL(*) CHLTYPE WHERE(CHLTYPE EQ SVRCONN)\\" | {mq_path}/bin/runmqsc {qmgr["name"]}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"{Fore.CYAN}║")
-                print(f"{Fore.CYAN}║ {Fore.RESET}Server-Connection Channels:")
+            output = mqsc.get(MQSC_SVRCONN_CHANNELS, '')
+            if output:
+                out(f"{_CYAN}║")
+                out(f"{_CYAN}║ {_RESET}Server-Connection Channels:")
                 
-                channel_info = {}
-                current_channel = None
-                
-                for line in result.stdout.splitlines():
-                    if 'CHANNEL(' in line:
-                        matches = re.findall(r'(\w+)\((.*?)\)', line)
-                        for key, value in matches:
-                            if key == 'CHANNEL':
-                                current_channel = value
-                                channel_info[current_channel] = {'name': value}
-                            elif current_channel:
-                                channel_info[current_channel][key] = value
+                channel_info = {
+                    record['CHANNEL']: record
+                    for record in group_kv_records(parse_kv_stream(output), 'CHANNEL')
+                }
                 
                 # Get channel status
-                cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY CHSTATUS(*) WHERE(CHLTYPE EQ SVRCONN)\\" | {mq_path}/bin/runmqsc {qmgr["name"]}"'
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                if result.returncode == 0:
-                    for line in result.stdout.splitlines():
-                        if 'CHANNEL(' in line:
-                            matches = re.findall(r'(\w+)\((.*?)\)', line)
-                            channel_name = None
-                            status_info = {}
-                            for key, value in matches:
-                                if key == 'CHANNEL':
-                                    channel_name = value
-                                else:
-                                    status_info[key] = value
-                            if channel_name and channel_name in channel_info:
-                                channel_info[channel_name].update(status_info)
+                for status_info in group_kv_records(parse_kv_stream(mqsc.get(MQSC_SVRCONN_CHSTATUS, '')), 'CHANNEL'):
+                    info = channel_info.get(status_info['CHANNEL'])
+                    if info is not None:
+                        info.update(status_info)
                 
                 # Display information about each channel
                 for channel_name, info in channel_info.items():
-                    print(f"{Fore.CYAN}║   {Fore.RESET}Channel: {Fore.GREEN}{channel_name}")
+                    out(f"{_CYAN}║   {_RESET}Channel: {_GREEN}{channel_name}")
                     if 'STATUS' in info:
-                        status_color = Fore.GREEN if info['STATUS'] == 'RUNNING' else Fore.RED
-                        print(f"{Fore.CYAN}║   {Fore.RESET}Status: {status_color}{info.get('STATUS', 'N/A')}")
+                        status_color = _GREEN if info['STATUS'] == 'RUNNING' else _RED
+                        out(f"{_CYAN}║   {_RESET}Status: {status_color}{info.get('STATUS', 'N/A')}")
                     if 'MCAUSER' in info:
-                        print(f"{Fore.CYAN}║   {Fore.RESET}MCAUSER: {info.get('MCAUSER', 'N/A')}")
+                        out(f"{_CYAN}║   {_RESET}MCAUSER: {info.get('MCAUSER', 'N/A')}")
                     if 'SSLCIPH' in info:
-                        print(f"{Fore.CYAN}║   {Fore.RESET}SSL Cipher: {info.get('SSLCIPH', 'NONE')}")
-                    print(f"{Fore.CYAN}║")
+                        out(f"{_CYAN}║   {_RESET}SSL Cipher: {info.get('SSLCIPH', 'NONE')}")
+                    out(f"{_CYAN}║")
                 
         except Exception as e:
-            print(f"{Fore.CYAN}║   {Fore.YELLOW}⚠ Unable to get SVRCONN channel information: {e}")
+            out(f"{_CYAN}║   {_YELLOW}⚠ Unable to get SVRCONN channel information: {e}")
         
         if qmgr['port']:
-            print(f"{Fore.CYAN}║")
-            print(f"{Fore.CYAN}║ {Fore.RESET}Port Status:")
-            if check_port_status('localhost', qmgr['port']):
-                print(f"{Fore.CYAN}║   {Fore.GREEN}✓ Port {qmgr['port']} is open")
+            out(f"{_CYAN}║")
+            out(f"{_CYAN}║ {_RESET}Port Status:")
+            if qmgr['port_open']:
+                out(f"{_CYAN}║   {_GREEN}✓ Port {qmgr['port']} is open")
             else:
-                print(f"{Fore.CYAN}║   {Fore.RED}✗ Port {qmgr['port']} is not accessible")
+                out(f"{_CYAN}║   {_RED}✗ Port {qmgr['port']} is not accessible")
         
         if qmgr['permissions']:
-            print(f"{Fore.CYAN}║")
-            print(f"{Fore.CYAN}║ {Fore.RESET}Security & Permissions:")
-            print(f"{Fore.CYAN}║   {Fore.RESET}Channel Authentication: {'Enabled' if qmgr['permissions']['chlauth'] else 'Disabled'}")
-            print(f"{Fore.CYAN}║   {Fore.RESET}Can Connect: {Fore.GREEN + '✓' if qmgr['permissions']['can_connect'] else Fore.RED + '✗'}")
-            print(f"{Fore.CYAN}║   {Fore.RESET}Can Browse System Queues: {Fore.GREEN + '✓' if qmgr['permissions']['can_browse'] else Fore.RED + '✗'}")
+            out(f"{_CYAN}║")
+            out(f"{_CYAN}║ {_RESET}Security & Permissions:")
+            out(f"{_CYAN}║   {_RESET}Channel Authentication: {'Enabled' if qmgr['permissions']['chlauth'] else 'Disabled'}")
+            out(f"{_CYAN}║   {_RESET}Can Connect: {_GREEN + '✓' if qmgr['permissions']['can_connect'] else _RED + '✗'}")
+            out(f"{_CYAN}║   {_RESET}Can Browse System Queues: {_GREEN + '✓' if qmgr['permissions']['can_browse'] else _RED + '✗'}")
             
             # Display active channels
             try:
-                cmd = f'sudo -u mqm bash -c "echo \\"DISPLAY CHSTATUS(*) WHERE(STATUS NE INACTIVE)\\" | {mq_path}/bin/runmqsc {qmgr["name"]}"'
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                if result.returncode == 0 and 'AMQ8417I' in result.stdout:
-                    print(f"{Fore.CYAN}║")
-                    print(f"{Fore.CYAN}║ {Fore.RESET}Active Channels:")
-                    for line in result.stdout.splitlines():
+                output = mqsc.get(MQSC_ACTIVE_CHSTATUS, '')
+                if 'AMQ8417I' in output:
+                    out(f"{_CYAN}║")
+                    out(f"{_CYAN}║ {_RESET}Active Channels:")
+                    for line in output.splitlines():
                         if 'CHANNEL(' in line:
-                            print(f"{Fore.CYAN}║   {Fore.RESET}{line.strip()}")
+                            out(f"{_CYAN}║   {_RESET}{line.strip()}")
             except Exception:
                 pass
         else:
-            print(f"{Fore.CYAN}║")
-            print(f"{Fore.CYAN}║ {Fore.YELLOW}⚠ Unable to retrieve permissions information")
+            out(f"{_CYAN}║")
+            out(f"{_CYAN}║ {_YELLOW}⚠ Unable to retrieve permissions information")
         
-        print(f"{Fore.CYAN}╚{'═' * 60}")
-        print()
+        out(f"{_CYAN}╚{'═' * 60}")
+        out("")
+        sys.stdout.write((_RESET_ALL + "\n").join(buf) + _RESET_ALL + "\n")
+
+@contextlib.contextmanager
+def open_config(path, size):
+    """Yield the config file as bytes, or as a read-only mmap for large files."""
+    with open(path, 'rb') as f:
+        if size < MMAP_MIN_SIZE:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+def yaml_loader(yaml):
+    """Return the libyaml-backed safe loader if available, else the pure-Python one."""
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def _config_cache_fresh(path, mtime_ns):
+    """Check if the JSON cache next to path is not older than the YAML file."""
+    try:
+        return os.stat(path + '.cache.json').st_mtime_ns >= mtime_ns
+    except OSError:
+        return False
+
+def _read_config_cache(path, mtime_ns):
+    """Return config from the JSON cache next to path, None if it is missing or outdated."""
+    if not _config_cache_fresh(path, mtime_ns):
+        return None
+    try:
+        with open(path + '.cache.json', 'rb') as f:
+            data = f.read()
+        orjson, _ = lazy_import('orjson')
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        # No usable cache, parse YAML instead
+        return None
+
+def _write_config_cache(path, config):
+    """Write JSON cache of parsed config atomically, failure only means no cache."""
+    cache_path = path + '.cache.json'
+    tmp_name = None
+    try:
+        orjson, _ = lazy_import('orjson')
+        data = orjson.dumps(config) if orjson is not None else json.dumps(config).encode('utf-8')
+        with tempfile.NamedTemporaryFile('wb', delete=False, dir=os.path.dirname(cache_path),
+                                         suffix='.tmp') as tmp:
+            tmp_name = tmp.name
+            tmp.write(data)
+        os.replace(tmp_name, cache_path)
+    except (OSError, TypeError, ValueError):
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+def load_config(path):
+    """Return mq_servers entries and their index by name."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    config = _read_config_cache(path, st.st_mtime_ns)
+    if config is None:
+        yaml, error = lazy_import('yaml')
+        if yaml is None:
+            raise error
+        with open_config(path, st.st_size) as data:
+            config = yaml.load(data, Loader=yaml_loader(yaml))
+        _write_config_cache(path, config)
+    if not isinstance(config, dict) or not isinstance(config.get('mq_servers', []), list):
+        raise ValueError("'mq_servers' must be a list of servers")
+    servers = []
+    servers_by_name = {}
+    for entry in config.get('mq_servers', []):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Invalid server entry in 'mq_servers': {entry!r}")
+        server = to_server(entry)
+        servers.append(server)
+        servers_by_name.setdefault(entry.get('name'), []).append(server)
+    return servers, servers_by_name
+
+def find_config_servers(path, name):
+    """Return the mq_servers entries called name."""
+    return load_config(path)[1].get(name, ())
+
+def test_server(server, overrides, args, addresses):
+    """Run network and MQ connection tests for one configured server and return its output."""
+    # Collect the whole section and write it at once
+    buf = []
+    out = buf.append
+    
+    print_header(f"Testing server: {server.name}", out)
+    
+    try:
+        # First do basic network connectivity test
+        cfg = server._replace(**overrides) if overrides else server
+        host = cfg.host
+        port = cfg.port
+        
+        port_available, _ = check_network_connectivity(host, port, out, addresses.get(host))
+        if port_available:
+            # If network test passes, try MQ connection
+            test_mq_connection(cfg, out=out)
+            check_mq_server_info(
+                host,
+                port,
+                cfg.channel or '',
+                cfg.queue_manager or '',
+                args,
+                out
+            )
+    except Exception as e:
+        # A failure is reported for this server only, the remaining servers are still tested
+        out(f"{_RED}✗ Error testing server {server.name}: {e}")
+    return (_RESET_ALL + "\n").join(buf) + _RESET_ALL + "\n"
 
 def main():
     args = parse_arguments()
+    # Colors only help on a terminal, piped output stays plain without loading colorama
+    if sys.stdout.isatty():
+        init_colors()
     print_header("IBM MQ Diagnostic Tool - Developed by robert.pesout@tietoevry.com")
     
     # Check system environment
     check_python_version()
     check_pymqi_installation()
     check_mq_client_libraries()
-    check_mq_installations()
     
-    # Add Queue Manager details section
-    display_qmgr_details()
+    # A single target needs no local installation scan or Queue Manager enumeration
+    if not (args.server or args.host or args.qm):
+        check_mq_installations()
+        
+        # Add Queue Manager details section
+        display_qmgr_details()
     
     # Load configuration
     try:
-        import yaml
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
-            
         # Filter servers by --server argument
-        servers = config.get('mq_servers', [])
         if args.server:
-            servers = [s for s in servers if s.get('name') == args.server]
-            if not servers:
-                print(f"{Fore.RED}Server '{args.server}' not found in configuration")
-                return
-        
-        for server in servers:
-            name = server.get('name', 'Unknown')
-            print_header(f"Testing server: {name}")
-            
-            # First do basic network connectivity test
-            host = args.host if args.host else server.get('host', 'localhost')
-            port = args.port if args.port else server.get('port', 1414)
-            
-            if check_network_connectivity(host, port):
-                # If network test passes, try MQ connection
-                test_mq_connection(server, args)
-                check_mq_server_info(
-                    host,
-                    port,
-                    args.channel if args.channel else server.get('channel', ''),
-                    args.qm if args.qm else server.get('queue_manager', ''),
-                    args
-                )
+            servers = find_config_servers(args.config, args.server)
+        else:
+            servers = load_config(args.config)[0]
+    except config_errors() as e:
+        print(f"{_RED}Error loading configuration: {e}")
+        print(f"{_YELLOW}Tip: Make sure config.yaml exists and has the correct format")
+        return
     
-    except Exception as e:
-        print(f"{Fore.RED}Error loading configuration: {e}")
-        print(f"{Fore.YELLOW}Tip: Make sure config.yaml exists and has the correct format")
+    if args.server and not servers:
+        print(f"{_RED}Server '{args.server}' not found in configuration")
+        return
+    
+    # Command line overrides are the same for every server
+    overrides = cli_overrides(args)
+    jobs = max(1, min(args.jobs, len(servers)))
+    
+    # Resolve every distinct host once, the probes then connect to the address directly
+    hosts = (overrides.get('host', server.host) for server in servers)
+    addresses = resolve_hosts({host for host in hosts if isinstance(host, str)})
+    
+    if jobs > 1:
+        # Servers are tested concurrently, map() keeps configuration order
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for text in executor.map(lambda server: test_server(server, overrides, args, addresses), servers):
+                sys.stdout.write(text)
+    else:
+        for server in servers:
+            sys.stdout.write(test_server(server, overrides, args, addresses))
 
 if __name__ == "__main__":
     main() 